@@ -333,7 +333,7 @@ def _emit_pil_plan(
                 stroke = kw.get("stroke")
                 ld.line([P(x1, y1), P(x2, y2)], fill=_rgba(str(stroke)), width=width)
             elif op == "polyline":
-                pts = [P(int(x), int(y)) for (x, y) in kw["points"]]
+                pts = [(cxl + int(x), cyl + int(y)) for (x, y) in kw["points"]]
                 width = int(kw.get("width", 1))
                 stroke = kw.get("stroke")
                 fill = kw.get("fill")
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import re
 import xml.etree.ElementTree as ET
-from collections.abc import Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from functools import lru_cache
 from pathlib import Path
 from shutil import copy2
-from typing import Any, Literal
+from threading import Lock
+from typing import Any, ClassVar, Literal
 
 try:
     import cairosvg
@@ -22,6 +25,7 @@ from PIL import Image, ImageDraw
 from models.styling import CapStyle, JoinStyle
 
 SVG_SUPPORTED: bool = cairosvg is not None
+MAX_THUMBS: int = 512
 
 class Formats(StrEnum):
     """Supported file formats for icons and exports."""
@@ -117,6 +121,9 @@ class Asset_Library:
         self.root = root
         self.icons_dir = root.parent.absolute() / "assets" / "icons"
         self.icons_dir.mkdir(parents=True, exist_ok=True)
+        self.thumbs_dir = self.icons_dir.parent / ".thumbs"
+        self._thumb_mem: OrderedDict[tuple[str, int, int], Image.Image] = OrderedDict()
+        self._thumb_lock = Lock()
 
     def list_pictures(self) -> list[Path]:
         """List available picture icons.
@@ -129,8 +136,28 @@ class Asset_Library:
             if Formats.check(p):
                 pics.append(p)
         pics.sort(key=lambda p: p.name.lower())
+        self._prune_thumbs(pics)
         return pics
 
+    def _prune_thumbs(self, pics: list[Path]) -> None:
+        # drop on-disk thumbnails whose picture was removed or replaced since they were written
+        try:
+            cached = list(self.thumbs_dir.glob("*.png"))
+        except OSError:
+            return
+        if not cached:
+            return
+        live: dict[str, str] = {}
+        for p in pics:
+            try:
+                live[self._thumb_stem(p)] = str(p.stat().st_mtime_ns)
+            except OSError:
+                pass
+        for f in cached:
+            stem, _, rest = f.stem.partition("_")
+            if live.get(stem) != rest.partition("_")[0]:
+                f.unlink(missing_ok=True)
+
     def import_files(self, paths: list[Path]) -> list[Path]:
         """Import picture files into the asset library.
 
@@ -153,6 +180,107 @@ class Asset_Library:
             out.append(dest)
         return out
 
+    def thumbnail(self, path: Path, size: int) -> Image.Image:
+        """Return a square thumbnail for a picture, reusing the memory and on-disk thumbnail caches.
+
+        The returned image may be shared between callers and must not be modified.
+
+        Args;
+            path: The picture path.
+            size: The thumbnail edge length in pixels.
+
+        Returns;
+            The RGBA thumbnail.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return _open_rgba(path, size, size, draft=True)
+        key = (str(path), mtime, size)
+        # gallery decodes run on worker threads
+        with self._thumb_lock:
+            im = self._thumb_mem.get(key)
+            if im is not None:
+                self._thumb_mem.move_to_end(key)
+                return im
+        im = self._thumbnail_from_disk(path, mtime, size)
+        with self._thumb_lock:
+            self._thumb_mem[key] = im
+            while len(self._thumb_mem) > MAX_THUMBS:
+                self._thumb_mem.popitem(last=False)
+        return im
+
+    def cached_thumbnail(self, path: Path, size: int) -> Image.Image | None:
+        """Return a picture's thumbnail only if it is already held in memory.
+
+        Cheap enough for the Tk thread; it never decodes or touches the on-disk cache.
+
+        Args;
+            path: The picture path.
+            size: The thumbnail edge length in pixels.
+
+        Returns;
+            The shared RGBA thumbnail, or None on a miss.
+        """
+        try:
+            key = (str(path), path.stat().st_mtime_ns, size)
+        except OSError:
+            return None
+        with self._thumb_lock:
+            im = self._thumb_mem.get(key)
+            if im is not None:
+                self._thumb_mem.move_to_end(key)
+            return im
+
+    def preview_thumbnail(self, path: Path, size: int) -> Image.Image | None:
+        """Return a quick, nearest-neighbour thumbnail to show while the real one is produced.
+
+        Args;
+            path: The picture path.
+            size: The thumbnail edge length in pixels.
+
+        Returns;
+            The RGBA preview, or None when :meth:`thumbnail` is already cheap (cached or SVG).
+        """
+        if path.suffix.lower() == ".svg":
+            return None
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        with self._thumb_lock:
+            if (str(path), mtime, size) in self._thumb_mem:
+                return None
+        if self._thumb_file(path, mtime, size)[1].exists():
+            return None
+        return _fast_open_rgba(path, size, size)
+
+    @staticmethod
+    def _thumb_stem(path: Path) -> str:
+        return hashlib.sha1(str(path.absolute()).encode()).hexdigest()[:16]
+
+    def _thumb_file(self, path: Path, mtime: int, size: int) -> tuple[str, Path]:
+        stem = self._thumb_stem(path)
+        return stem, self.thumbs_dir / f"{stem}_{mtime}_{size}.png"
+
+    def _thumbnail_from_disk(self, path: Path, mtime: int, size: int) -> Image.Image:
+        stem, cached = self._thumb_file(path, mtime, size)
+        try:
+            with Image.open(cached) as im:
+                return im.convert("RGBA")
+        except OSError:
+            pass
+        im = _open_rgba(path, size, size, draft=True)
+        try:
+            self.thumbs_dir.mkdir(parents=True, exist_ok=True)
+            # drop thumbnails of older versions of the same file
+            for old in self.thumbs_dir.glob(f"{stem}_*_{size}.png"):
+                old.unlink(missing_ok=True)
+            im.save(cached, optimize=False, compress_level=1)
+        except OSError:
+            pass
+        return im
+
 
 _ICON_LIB: Asset_Library | None = None
 
@@ -184,7 +312,7 @@ def _missing_rgba(w: int, h: int) -> Image.Image:
     return img
 
 
-def _open_rgba(src: Path, w: int, h: int) -> Image.Image:
+def _open_rgba(src: Path, w: int, h: int, *, draft: bool = False) -> Image.Image:
     w = max(1, int(w))
     h = max(1, int(h))
     ext = src.suffix[1:].lower()
@@ -199,7 +327,12 @@ def _open_rgba(src: Path, w: int, h: int) -> Image.Image:
             return _missing_rgba(w, h)
     else:
         try:
-            im = Image.open(src).convert("RGBA")
+            with Image.open(src) as raw:
+                if draft:
+                    # lets JPEG decode at a reduced IDCT scale that is still >= the target size; only worth
+                    # the quality loss for thumbnails, not export or canvas painting
+                    raw.draft("RGB", (w, h))
+                im = raw.convert("RGBA")
         except Exception:
             return _missing_rgba(w, h)
         if im.size != (w, h):
@@ -207,6 +340,21 @@ def _open_rgba(src: Path, w: int, h: int) -> Image.Image:
         return im
 
 
+def _fast_open_rgba(src: Path, w: int, h: int) -> Image.Image | None:
+    # draft() at twice the target keeps JPEG decodes cheap while leaving NEAREST something to sample
+    w = max(1, int(w))
+    h = max(1, int(h))
+    try:
+        with Image.open(src) as raw:
+            raw.draft("RGB", (w * 2, h * 2))
+            im = raw.convert("RGBA")
+    except Exception:
+        return None
+    if im.size != (w, h):
+        im = im.resize((w, h), Image.Resampling.NEAREST)
+    return im
+
+
 # === Names ===========================================================
 class Icon_Name(StrEnum):
     """Names for builtin icon definitions."""
@@ -329,6 +477,8 @@ class IconDef:
 class Builtins:
     """Factory for builtin icon definitions."""
 
+    _icons: ClassVar[dict[Icon_Name, IconDef] | None] = None
+
     @classmethod
     def _plus(cls) -> IconDef:
         vb = (-500.0, -500.0, 1000.0, 1000.0)
@@ -615,6 +765,9 @@ class Builtins:
         Returns;
             The icon definition.
         """
+        # the definitions are static, so the table is built once rather than on every lookup
+        if cls._icons is not None:
+            return cls._icons[name]
         ICONS: dict[Icon_Name, IconDef] = {
             # --- generic ---
             Icon_Name.PLUS: cls._plus(),
@@ -648,12 +801,116 @@ class Builtins:
             Icon_Name.GROUND: cls._ground(),
             Icon_Name.SWITCH_SPST: cls._switch_spst(),
         }
+        cls._icons = ICONS
         return ICONS[name]
 
 
+@dataclass(frozen=True, slots=True)
+class _PlanCtx:
+    """Per-plan transform and colour shared by the plan handlers; built once per icon, not per primitive."""
+
+    cx: float
+    cy: float
+    s: float
+    col_svg: str
+
+    def T(self, px: float, py: float) -> tuple[int, int]:
+        """Transform idef-space to origin-centred, scaled icon-space."""
+        return round((px - self.cx) * self.s), round((py - self.cy) * self.s)
+
+
+def _plan_circle(
+    prim: Primitives.Circle, c: _PlanCtx, width: int, stroke: str | None, fill: str | None, dash: list[int] | None
+) -> tuple[str, dict[str, Any]]:
+    x, y = c.T(prim.cx, prim.cy)
+    entry: dict[str, Any] = {"cx": x, "cy": y, "r": max(1, round(prim.r * c.s))}
+    if fill:
+        entry["fill"] = fill
+    if stroke:
+        entry["stroke"] = stroke
+        entry["width"] = width
+    return "circle", entry
+
+
+def _plan_rect(
+    prim: Primitives.Rect, c: _PlanCtx, width: int, stroke: str | None, fill: str | None, dash: list[int] | None
+) -> tuple[str, dict[str, Any]]:
+    x0, y0 = c.T(prim.x, prim.y)
+    entry: dict[str, Any] = {"x": x0, "y": y0, "w": round(prim.w * c.s), "h": round(prim.h * c.s)}
+    if fill:
+        entry["fill"] = fill
+    if stroke:
+        entry["stroke"] = stroke
+        entry["width"] = width
+    return "rect", entry
+
+
+def _plan_line(
+    prim: Primitives.Line, c: _PlanCtx, width: int, stroke: str | None, fill: str | None, dash: list[int] | None
+) -> tuple[str, dict[str, Any]]:
+    x1, y1 = c.T(prim.x1, prim.y1)
+    x2, y2 = c.T(prim.x2, prim.y2)
+    entry: dict[str, Any] = {
+        "x1": x1,
+        "y1": y1,
+        "x2": x2,
+        "y2": y2,
+        "width": width,
+        "stroke": stroke or c.col_svg,
+        "cap": prim.style.line_cap.value,
+    }
+    if dash:
+        entry["dash"] = dash
+    return "line", entry
+
+
+def _plan_polyline(
+    prim: Primitives.Polyline, c: _PlanCtx, width: int, stroke: str | None, fill: str | None, dash: list[int] | None
+) -> tuple[str, dict[str, Any]]:
+    # one comprehension instead of a T() call per vertex
+    cx, cy, s = c.cx, c.cy, c.s
+    entry: dict[str, Any] = {
+        "points": [(round((px - cx) * s), round((py - cy) * s)) for px, py in prim.points],
+        "closed": prim.closed,
+    }
+    if fill:
+        entry["fill"] = fill
+    if stroke:
+        entry["stroke"] = stroke
+        entry["width"] = width
+    entry["join"] = prim.style.line_join.value
+    if dash:
+        entry["dash"] = dash
+    return "polyline", entry
+
+
+_PlanHandler = Callable[[Any, _PlanCtx, int, str | None, str | None, list[int] | None], tuple[str, dict[str, Any]]]
+
+_PLAN_HANDLERS: dict[type, _PlanHandler] = {
+    Primitives.Circle: _plan_circle,
+    Primitives.Rect: _plan_rect,
+    Primitives.Line: _plan_line,
+    Primitives.Polyline: _plan_polyline,
+}
+
+
+@lru_cache(maxsize=None)
+def _plan_handler(tp: type) -> _PlanHandler | None:
+    # exact type first, then the MRO so primitive subclasses still plan; unknown primitives are skipped
+    # rather than exploding in export
+    for base in tp.__mro__:
+        handler = _PLAN_HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    return None
+
+
+@lru_cache(maxsize=256)
 def _builtin_icon_plan(name: Icon_Name, size: int, col_svg: str) -> list[tuple[str, dict[str, Any]]]:
     """Build a device-agnostic drawing plan for a builtin icon.
 
+    Plans are cached per (name, size, colour) and shared, so callers must treat them as read-only.
+
     Args;
         name: The builtin icon name.
         size: Target size in pixels.
@@ -668,81 +925,23 @@ def _builtin_icon_plan(name: Icon_Name, size: int, col_svg: str) -> list[tuple[s
     cx = minx + vbw / 2.0
     cy = miny + vbh / 2.0
 
-    def T(px: float, py: float) -> tuple[int, int]:
-        """Transform idef-space to origin-centred, scaled icon-space."""
-        return round((px - cx) * s), round((py - cy) * s)
-
     plan: list[tuple[str, dict[str, Any]]] = []
+    ctx = _PlanCtx(cx=cx, cy=cy, s=s, col_svg=col_svg)
 
     for prim in idef.prims:
-        sty = prim.style
-        width = max(1, round((sty.stroke_width or 1.0) * s))
-        stroke = col_svg if sty.stroke else None
-        fill = col_svg if sty.fill else None
-        dash = None
-        if sty.dash:
-            dash = [max(1, round(d * s)) for d in sty.dash]
-
-        if isinstance(prim, Primitives.Circle):
-            x, y = T(prim.cx, prim.cy)
-            r = max(1, round(prim.r * s))
-            entry: dict[str, Any] = {"cx": x, "cy": y, "r": r}
-            if fill:
-                entry["fill"] = fill
-            if stroke:
-                entry["stroke"] = stroke
-                entry["width"] = width
-            plan.append(("circle", entry))
-
-        elif isinstance(prim, Primitives.Rect):
-            x0, y0 = T(prim.x, prim.y)
-            w = round(prim.w * s)
-            h = round(prim.h * s)
-            entry: dict[str, Any] = {"x": x0, "y": y0, "w": w, "h": h}
-            if fill:
-                entry["fill"] = fill
-            if stroke:
-                entry["stroke"] = stroke
-                entry["width"] = width
-            plan.append(("rect", entry))
-
-        elif isinstance(prim, Primitives.Line):
-            x1, y1 = T(prim.x1, prim.y1)
-            x2, y2 = T(prim.x2, prim.y2)
-            entry: dict[str, Any] = {
-                "x1": x1,
-                "y1": y1,
-                "x2": x2,
-                "y2": y2,
-                "width": width,
-                "stroke": stroke or col_svg,
-            }
-            entry["cap"] = sty.line_cap.value
-            if dash:
-                entry["dash"] = dash
-            plan.append(("line", entry))
-
-        elif isinstance(prim, Primitives.Polyline):
-            pts = []
-            for px, py in prim.points:
-                tx, ty = T(px, py)
-                pts.append((tx, ty))
-            entry: dict[str, Any] = {
-                "points": pts,
-                "closed": prim.closed,
-            }
-            if fill:
-                entry["fill"] = fill
-            if stroke:
-                entry["stroke"] = stroke
-                entry["width"] = width
-            entry["join"] = sty.line_join.value
-            if dash:
-                entry["dash"] = dash
-            plan.append(("polyline", entry))
-
-        else:
-            # Unknown primitive; ignore rather than exploding in export
+        handler = _plan_handler(type(prim))
+        if handler is None:
             continue
+        sty = prim.style
+        plan.append(
+            handler(
+                prim,
+                ctx,
+                max(1, round((sty.stroke_width or 1.0) * s)),
+                col_svg if sty.stroke else None,
+                col_svg if sty.fill else None,
+                [max(1, round(d * s)) for d in sty.dash] if sty.dash else None,
+            )
+        )
 
     return plan
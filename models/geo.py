@@ -395,6 +395,22 @@ def tag_sort(
 Deletable = int | ItemID | str
 
 
+def _stipple_bucket(a: int) -> str | None:
+    if a >= 250:
+        return None
+    if a >= 192:
+        return "gray12"
+    if a >= 128:
+        return "gray25"
+    if a >= 64:
+        return "gray50"
+    return "gray75"
+
+
+# looked up for every drawn item, so bucket all 256 alphas once
+_STIPPLE_BY_ALPHA: tuple[str | None, ...] = tuple(_stipple_bucket(a) for a in range(256))
+
+
 class CanvasLW(tk.Canvas):
     """Tk canvas with typed convenience helpers."""
 
@@ -410,17 +426,7 @@ class CanvasLW(tk.Canvas):
             a = alpha.alpha
         else:
             a = alpha
-        if a >= 250:
-            return None
-        if a >= 192:
-            return "gray12"
-        if a >= 128:
-            return "gray25"
-        if a >= 64:
-            return "gray50"
-        if a > 0:
-            return "gray75"
-        return "gray75"
+        return _STIPPLE_BY_ALPHA[min(max(a, 0), 255)]
 
     def _create_dashed_segments(
         self,
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
 import tkinter as tk
+from collections import OrderedDict
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
+from time import monotonic
 from tkinter import ttk
-from typing import TypeVar
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary, WeakSet
 
 from PIL import Image, ImageTk
 
@@ -16,6 +21,17 @@ from models.styling import Colour, Colours, LineStyle
 from ui.colour_picker import ask_colour
 from ui.composite_spinbox import Composite_Spinbox
 
+SWATCH_SIZE: int = 20
+MAX_SWATCH_CACHE: int = 64
+MAX_STALE_OVERLAYS: int = 64
+POPUP_TAG: str = "LW.PaletteRoot"
+
+_SORTED_LINE_STYLES: tuple[str, ...] = tuple(sorted((s.value for s in LineStyle), key=str.lower))
+_COLOURS_ALL: tuple[Colour, ...] = tuple(Colours.list())
+_COLOURS_MIN25: tuple[Colour, ...] = tuple(Colours.list(min_alpha=25))
+# keyed by interpreter too: an image from a destroyed root would raise "image doesn't exist" in a new one
+_SWATCH_CACHE: OrderedDict[tuple[Any, str, int], ImageTk.PhotoImage] = OrderedDict()
+
 
 class Tool_Name(StrEnum):
     """Tool mode identifiers."""
@@ -26,50 +42,148 @@ class Tool_Name(StrEnum):
     select = "select"
 
 
-TWidget = TypeVar("TWidget", bound=tk.Widget)
-
-
-@dataclass
+@dataclass(slots=True)
 class Palette_Handles:
     """Handles for a colour palette widget."""
 
-    frame: ttk.Frame
+    frame: Colour_Palette
     set_selected: Callable[[str], None]
     "call with colour hexa"
 
 
-def _checker_photo(
-    master: tk.Misc,
+@lru_cache(maxsize=256)
+def _parse_colour(text: str) -> Colour:
+    # selections outside a palette (custom slots, loaded projects) repeat; Colour is immutable so sharing is safe
+    return Colours.parse_colour(text)
+
+
+def _checker_image(
     w: int = 20,
     h: int = 20,
     tile: int = 4,
     a: str = "#eeeeee",
     b: str = "#cccccc",
-) -> ImageTk.PhotoImage:
+) -> Image.Image:
     img = Image.new("RGB", (w, h), a)
     for y in range(0, h, tile):
         start = ((y // tile) % 2) * tile
         for x in range(start, w, tile * 2):
             Image.Image.paste(img, b, (x, y, x + tile, y + tile))
-    return ImageTk.PhotoImage(img, master=master)
-
-
-def _draw_swatch(canvas: CanvasLW, col: Colour, *, outline: str) -> int:
-    if not canvas.cache.checker_ref:
-        ph = _checker_photo(canvas, 20, 20)
-        canvas.cache.checker_ref = (0, ph)
-    canvas.create_image(1, 1, image=canvas.cache.checker_ref[1], anchor="nw")
-    if col.alpha == 0:
-        return canvas.create_rectangle(1, 1, 21, 21, outline=outline, fill="")
-    return canvas.create_rectangle(
-        1,
-        1,
-        21,
-        21,
-        outline=outline,
-        fill=col.hexh,
-        stipple=CanvasLW._stipple_for_alpha(col.alpha) or "",
-    )
+    return img
+
+
+def _swatch_photo(master: tk.Misc, col: Colour) -> ImageTk.PhotoImage:
+    # translucent colours are pre-composited over the checker once, then reused
+    key = (master.tk, col.hexh, col.alpha)
+    ph = _SWATCH_CACHE.get(key)
+    if ph is not None:
+        _SWATCH_CACHE.move_to_end(key)
+        return ph
+    base = _checker_image(SWATCH_SIZE, SWATCH_SIZE).convert("RGBA")
+    comp = Image.alpha_composite(base, Image.new("RGBA", base.size, col.rgba))
+    ph = ImageTk.PhotoImage(comp.convert("RGB"), master=master)
+    _SWATCH_CACHE[key] = ph
+    while len(_SWATCH_CACHE) > MAX_SWATCH_CACHE:
+        _SWATCH_CACHE.popitem(last=False)
+    return ph
+
+
+def _draw_swatch(
+    canvas: CanvasLW, col: Colour, *, outline: str, slot: str = "swatch", x: float = 1, y: float = 1
+) -> int:
+    # items are created once per slot and reconfigured afterwards; x/y only apply on creation
+    items: dict[str, list[int | None]] | None = getattr(canvas, "_swatch_items", None)
+    if items is None:
+        items = canvas._swatch_items = {}
+        canvas._swatch_photos = {}
+    ids = items.get(slot)
+    img_id = ids[0] if ids else None
+    if col.alpha < 255:
+        ph = _swatch_photo(canvas, col)
+        canvas._swatch_photos[slot] = ph  # keep a ref while displayed, the cache may evict it
+        if img_id is None:
+            if ids:
+                x, y = canvas.coords(ids[1])[:2]
+            img_id = canvas.create_image(x, y, image=ph, anchor="nw", tags=(slot,))
+            if ids:
+                canvas.tag_lower(img_id, ids[1])
+        else:
+            canvas.itemconfigure(img_id, image=ph, state="normal")
+        fill = ""
+    else:
+        if img_id is not None:
+            canvas.itemconfigure(img_id, state="hidden")
+        canvas._swatch_photos.pop(slot, None)
+        fill = col.hexh
+    if ids is None:
+        rect_id = canvas.create_rectangle(
+            x, y, x + SWATCH_SIZE, y + SWATCH_SIZE, outline=outline, fill=fill, tags=(slot,)
+        )
+        items[slot] = [img_id, rect_id]
+    else:
+        rect_id = ids[1]
+        ids[0] = img_id
+        canvas.itemconfigure(rect_id, outline=outline, fill=fill)
+    return rect_id
+
+
+class _Debounced:
+    """Collapse a burst of calls into one run ``ms`` after the last; ``now()`` runs straight away."""
+
+    __slots__ = ("_fn", "_ms", "_pending", "_root")
+
+    def __init__(self, root: tk.Misc, fn: Callable[[], None], ms: int = 50) -> None:
+        self._root = root
+        self._fn = fn
+        self._ms = ms
+        self._pending: str | None = None
+
+    def __call__(self) -> None:
+        if self._pending is not None:
+            self._root.after_cancel(self._pending)
+        self._pending = self._root.after(self._ms, self._run)
+
+    def now(self) -> None:
+        """Run the callback immediately, dropping any deferred call."""
+        if self._pending is not None:
+            self._root.after_cancel(self._pending)
+        self._run()
+
+    def _run(self) -> None:
+        self._pending = None
+        self._fn()
+
+
+class Custom_Palette_Model:
+    """Custom colour slots shared by several palettes."""
+
+    def __init__(
+        self,
+        values: list[Colour | None],
+        on_update: Callable[[int, Colour | None], None] | None = None,
+    ) -> None:
+        """Create a shared custom palette.
+
+        Args;
+            values: The custom colour slots, mutated in place.
+            on_update: Optional callback when a slot changes.
+        """
+        self.values = values
+        self.on_update = on_update
+        self.listeners: WeakSet[Colour_Palette] = WeakSet()
+
+    def set(self, idx: int, col: Colour | None) -> None:
+        """Update one slot and redraw it in every listening palette.
+
+        Args;
+            idx: Slot index.
+            col: The new colour, or None to clear the slot.
+        """
+        self.values[idx] = col
+        if self.on_update:
+            self.on_update(idx, col)
+        for pal in self.listeners:
+            pal._draw_custom(idx, col)
 
 
 class Colour_Palette(ttk.Frame):
@@ -84,6 +198,7 @@ class Colour_Palette(ttk.Frame):
         on_select: Callable[[str], None],
         custom: list[Colour | None] | None = None,
         on_update_custom: Callable[[int, Colour | None], None] | None = None,
+        custom_model: Custom_Palette_Model | None = None,
     ) -> None:
         """Create a colour palette widget.
 
@@ -93,14 +208,29 @@ class Colour_Palette(ttk.Frame):
             on_select: Callback when a colour is selected.
             custom: Optional custom colours.
             on_update_custom: Optional callback when custom colours change.
+            custom_model: Optional shared custom palette; overrides custom and on_update_custom.
         """
         super().__init__(master)
         self._on_select = on_select
-        self._colours = list(colours)
-        self._swatches: list[tuple[CanvasLW, str]] = []
+        self._colours = colours if isinstance(colours, tuple) else tuple(colours)
+        self._colour_hexahs = tuple(c.hexah for c in self._colours)
+        self._by_hexah = dict(zip(self._colour_hexahs, self._colours))
+        self._swatches: list[str] = []
+        "hexah per popup slot, builtins first then custom"
+        self._pop_canvas: CanvasLW | None = None
         self._popup: tk.Toplevel | None = None
-        self._custom: list[Colour | None] = custom if custom is not None else [None] * len(Colours.list())
-        self._on_update_custom = on_update_custom
+        self._popup_open = False
+        self._custom_drawn: list[Colour | None] = []
+        "custom slot values as last drawn in the popup"
+        if custom_model is None:
+            custom_model = Custom_Palette_Model(
+                custom if custom is not None else [None] * len(_COLOURS_ALL), on_update_custom
+            )
+        self._custom_model = custom_model
+        custom_model.listeners.add(self)
+        self._popup_geom: tuple[int, int, int, int] | None = None
+        self._btn_geom: tuple[int, int, int, int] | None = None
+        self._editing = False
 
         self._canvas = CanvasLW(self, width=22, height=22, highlightthickness=1)
         self._btn = self._canvas
@@ -108,13 +238,22 @@ class Colour_Palette(ttk.Frame):
             highlightbackground=Colours.sys.dark_gray.hexh,
             highlightcolor=Colours.sys.dark_gray.hexh,
         )
-        self._rect_id = _draw_swatch(self._btn, Colours.black, outline=Colours.black.hexh)
+        # the swatch (and any premixed image) is drawn on first map; until then only the colour is recorded
+        self._pending_colour: Colour | None = Colours.black
         self._btn.pack(side="left", padx=4)
         self._btn.bind("<Button-1>", self._toggle_popup)
+        self._btn.bind("<Map>", self._on_first_map, add="+")
+        self._btn.bind("<Configure>", self._refresh_geom, add="+")
+
+    def _on_first_map(self, _evt: tk.Event | None = None) -> None:
+        self._btn.unbind("<Map>")
+        col, self._pending_colour = self._pending_colour, None
+        if col is not None:
+            _draw_swatch(self._btn, col, outline=Colours.black.hexh)
 
     # ------- popup -------
     def _toggle_popup(self, _evt: tk.Event | None = None) -> None:
-        if self._popup:
+        if self._popup_open:
             self._close_popup()
         else:
             if Colour_Palette._open_owner and Colour_Palette._open_owner is not self:
@@ -127,137 +266,281 @@ class Colour_Palette(ttk.Frame):
     def _open_popup(self, _evt: tk.Event | None = None) -> None:
         self._close_popup()
         Colour_Palette._open_owner = self
-        top = tk.Toplevel(self)
-        top.wm_overrideredirect(True)
-        top.transient(self.winfo_toplevel())
+        # the popup is built once and withdrawn on close; reopening only refreshes custom slots that changed
+        self._refresh_custom()
+        top = self._popup
+        if top is None or not top.winfo_exists():
+            top = self._build_popup()
 
         bx = self._btn.winfo_rootx()
         by = self._btn.winfo_rooty() + self._btn.winfo_height()
         top.geometry(f"+{bx}+{by}")
+        top.deiconify()
+        self._popup_open = True
+        self._popup_geom = self._btn_geom = None
+
+        top.focus_force()
+        try:
+            top.grab_set()
+        except Exception:
+            pass
+        top.after_idle(self._arm_outside_handlers)
+
+    def _build_popup(self) -> tk.Toplevel:
+        top = tk.Toplevel(self)
+        top.withdraw()
+        top.wm_overrideredirect(True)
+        top.transient(self.winfo_toplevel())
 
         frame = ttk.Frame(top, borderwidth=1, relief="solid")
         frame.pack(fill="both", expand=True)
 
-        left = ttk.Frame(frame)
-        left.pack(side="left", padx=6, pady=6)
-        right = ttk.Frame(frame)
-        right.pack(side="left", padx=(0, 6), pady=6)
-        ttk.Label(right, text="Custom").pack(anchor="w", padx=2, pady=(0, 4))
+        # every swatch is an item on one canvas; clicks are dispatched by the item's slot tag
+        canvas = CanvasLW(frame, highlightthickness=0)
+        canvas.pack(padx=6, pady=6)
+        outline = Colours.sys.dark_gray.hexh
+        pitch = SWATCH_SIZE + 4
+        self._swatches[:] = self._colour_hexahs
 
-        self._swatches.clear()
         # Built-ins (left)
-        for col in self._colours:
-            c = CanvasLW(left, width=22, height=22, highlightthickness=0)
-            _draw_swatch(c, col, outline=Colours.sys.dark_gray.hexh)
-            # c.create_rectangle(1, 1, 21, 21, outline=Colours.sys.dark_gray.hexh, fill=col.hexh)
-            c.bind("<Button-1>", lambda _e, hexa=col.hexah: (self._select(hexa), self._close_popup()))
-            c.pack(side="top", pady=2)
-            self._swatches.append((c, col.hexah))
+        for i, col in enumerate(self._colours):
+            _draw_swatch(canvas, col, outline=outline, slot=f"slot{i}", x=1, y=1 + i * pitch)
 
         # Custom (right)
+        cx = pitch + 6
+        head = canvas.create_text(cx, 0, text="Custom", anchor="nw")
+        head_w, cy = canvas.bbox(head)[2:]
+        cy += 4
+        base = len(self._colours)
         for i, val in enumerate(self._custom):
-            c = CanvasLW(right, width=22, height=22, highlightthickness=0)
-            # fill = Colours.white.hexh if val is None else val.hexh
-            # c.create_rectangle(1, 1, 21, 21, outline=Colours.sys.dark_gray.hexh, fill=fill)
-            if val is None:
-                c.create_rectangle(1, 1, 21, 21, outline=Colours.sys.dark_gray.hexh, fill=Colours.white.hexh)
-                c.bind("<Button-1>", lambda _e, i=i: self._edit_custom(i, None))
-            else:
-                _draw_swatch(c, val, outline=Colours.sys.dark_gray.hexh)
-                c.bind("<Button-1>", lambda _e, hexa=val.hexah: (self._select(hexa), self._close_popup()))
-                c.bind("<Shift-Button-1>", lambda _e, i=i, init=val: self._edit_custom(i, init))
-            c.bind("<Button-3>", lambda _e, i=i: self._clear_custom(i))
-            c.pack(side="top", pady=2)
-            self._swatches.append((c, val.hexah if val else ""))
-
-        top.focus_force()
-        try:
-            top.grab_set()
-        except Exception:
-            pass
+            _draw_swatch(
+                canvas, val or Colours.white, outline=outline, slot=f"slot{base + i}", x=cx + 1, y=cy + 1 + i * pitch
+            )
+            self._swatches.append(val.hexah if val else "")
+        self._custom_drawn = list(self._custom)
+
+        canvas.configure(width=max(cx + pitch, head_w), height=max(base * pitch, cy + len(self._custom) * pitch))
+        canvas.bind("<Button-1>", self._on_swatch_click)
+        canvas.bind("<Shift-Button-1>", self._on_swatch_shift_click)
+        canvas.bind("<Button-3>", self._on_swatch_right_click)
+        self._pop_canvas = canvas
+
+        # Escape and outside clicks arrive on the popup while it holds the grab; a class tag on its
+        # widgets catches them without touching the global "all" bindings on every open/close
+        top.bind_class(POPUP_TAG, "<Escape>", Colour_Palette._on_popup_escape)
+        top.bind_class(POPUP_TAG, "<ButtonRelease-1>", Colour_Palette._on_popup_release)
+        for w in (top, frame, canvas):
+            w.bindtags((POPUP_TAG, *w.bindtags()))
 
         self._popup = top
         top.bind("<Destroy>", self._on_popup_destroy, add="+")
-        top.after_idle(self._arm_outside_handlers)
+        top.bind("<Configure>", self._refresh_geom, add="+")
+        return top
 
-    def _on_popup_destroy(self, _e: tk.Event | None = None) -> None:
-        try:
-            self.unbind_all("<Escape>")
-            self.unbind_all("<ButtonRelease-1>")
-        except Exception:
-            pass
+    @staticmethod
+    def _on_popup_escape(evt: tk.Event) -> None:
+        if Colour_Palette._open_owner is not None:
+            Colour_Palette._open_owner._maybe_close_on_escape(evt)
+
+    @staticmethod
+    def _on_popup_release(evt: tk.Event) -> None:
+        if Colour_Palette._open_owner is not None:
+            Colour_Palette._open_owner._maybe_close_on_click(evt)
+
+    def _draw_custom(self, idx: int, col: Colour | None) -> None:
+        if self._pop_canvas is None:
+            return
+        slot = len(self._colours) + idx
+        _draw_swatch(self._pop_canvas, col or Colours.white, outline=Colours.sys.dark_gray.hexh, slot=f"slot{slot}")
+        self._swatches[slot] = col.hexah if col else ""
+        self._custom_drawn[idx] = col
+
+    def _refresh_custom(self) -> None:
+        # the custom list was swapped: redraw changed slots, or rebuild on next open if the slot count differs
+        if self._pop_canvas is None:
+            return
+        if len(self._custom) != len(self._custom_drawn):
+            self._close_popup()
+            if self._popup is not None:
+                try:
+                    self._popup.destroy()
+                except tk.TclError:
+                    pass
+            return
+        for i, val in enumerate(self._custom):
+            if val != self._custom_drawn[i]:
+                self._draw_custom(i, val)
+
+    def _on_popup_destroy(self, e: tk.Event | None = None) -> None:
+        # children's <Destroy> also reaches the Toplevel binding
+        if e is not None and str(e.widget) != str(self._popup):
+            return
         self._popup = None
+        self._popup_open = False
         self._swatches.clear()
+        self._custom_drawn = []
+        self._pop_canvas = None
         if Colour_Palette._open_owner is self:
             Colour_Palette._open_owner = None
 
     def _close_popup(self) -> None:
+        if not self._popup_open:
+            return
+        self._popup_open = False
         if self._popup is not None:
             try:
-                self.unbind_all("<Escape>")
-                self.unbind_all("<ButtonRelease-1>")
                 self._popup.grab_release()
+                self._popup.withdraw()
             except Exception:
                 pass
-            try:
-                self._popup.destroy()
-            except Exception:
-                pass
-            self._popup = None
-            self._swatches.clear()
-            if Colour_Palette._open_owner is self:
-                Colour_Palette._open_owner = None
+        if Colour_Palette._open_owner is self:
+            Colour_Palette._open_owner = None
 
     def _arm_outside_handlers(self) -> None:
-        if not self._popup:
+        if not self._popup_open or self._popup is None:
             return
         self._popup.update_idletasks()
-        self.bind_all("<Escape>", lambda _evt: self._close_popup(), add="+")
-        self.bind_all("<ButtonRelease-1>", self._maybe_close_on_click, add="+")
+        self._refresh_geom()
+
+    def _refresh_geom(self, _evt: tk.Event | None = None) -> None:
+        # outside-click hit tests use these snapshots; they change only on <Configure>
+        if not self._popup_open or self._popup is None:
+            return
+        self._popup_geom = self._root_geom(self._popup)
+        self._btn_geom = self._root_geom(self._btn)
+
+    def _slot_at_pointer(self) -> int | None:
+        if self._pop_canvas is None:
+            return None
+        for tag in self._pop_canvas.gettags("current"):
+            if tag.startswith("slot"):
+                return int(tag[4:])
+        return None
+
+    def _on_swatch_click(self, _evt: tk.Event | None = None) -> None:
+        idx = self._slot_at_pointer()
+        if idx is None:
+            return
+        base = len(self._colours)
+        if idx < base:
+            self._select(self._swatches[idx])
+            self._close_popup()
+        else:
+            self._on_custom_click(idx - base)
+
+    def _on_swatch_shift_click(self, evt: tk.Event | None = None) -> None:
+        idx = self._slot_at_pointer()
+        base = len(self._colours)
+        if idx is None or idx < base:
+            self._on_swatch_click(evt)
+            return
+        self._edit_custom(idx - base, self._custom[idx - base])
+
+    def _on_swatch_right_click(self, _evt: tk.Event | None = None) -> None:
+        idx = self._slot_at_pointer()
+        base = len(self._colours)
+        if idx is not None and idx >= base:
+            self._clear_custom(idx - base)
 
     def _ask_custom_colour(self, initial: Colour | None) -> Colour | None:
         return ask_colour(self, initial)
 
-    def _edit_custom(self, idx: int, initial: Colour | None) -> None:
+    def _on_custom_click(self, idx: int) -> None:
+        col = self._custom[idx]
+        if col is None:
+            self._edit_custom(idx, None)
+            return
+        self._select(col.hexah)
         self._close_popup()
+
+    def _edit_custom(self, idx: int, initial: Colour | None) -> None:
+        # hide the popup rather than tear it down, so the slot can be updated in place
+        popup = self._popup
+        self._editing = True
+        if popup is not None:
+            try:
+                popup.grab_release()
+                popup.withdraw()
+            except tk.TclError:
+                pass
         try:
             col = self._ask_custom_colour(initial)
         except tk.TclError as exc:
             if "application has been destroyed" in str(exc):
                 return
             raise
+        finally:
+            self._editing = False
         if not col:
+            # cancelled: bring the popup back so another slot can be picked
+            if popup is not None and popup is self._popup and self._popup_open:
+                try:
+                    popup.deiconify()
+                    popup.grab_set()
+                except tk.TclError:
+                    pass
             return
-        self._custom[idx] = col
-        if self._on_update_custom:
-            self._on_update_custom(idx, col)
+        self._set_custom(idx, col)
         self._select(col.hexah)
+        self._close_popup()
 
     def _clear_custom(self, idx: int) -> None:
-        self._custom[idx] = None
-        if self._on_update_custom:
-            self._on_update_custom(idx, None)
-        self._close_popup()
+        self._set_custom(idx, None)
+
+    def _set_custom(self, idx: int, col: Colour | None) -> None:
+        self._custom_model.set(idx, col)
+
+    @property
+    def _custom(self) -> list[Colour | None]:
+        return self._custom_model.values
+
+    def _maybe_close_on_escape(self, _evt: tk.Event | None = None) -> None:
+        if not self._editing:
+            self._close_popup()
 
     def _maybe_close_on_click(self, evt: tk.Event) -> None:
-        if not self._popup or not self._popup.winfo_exists():
-            self._popup = None
+        if self._editing:
             return
-        x, y = evt.x_root, evt.y_root
-        px, py = self._popup.winfo_rootx(), self._popup.winfo_rooty()
-        pw, ph = self._popup.winfo_width(), self._popup.winfo_height()
-        inside = (px <= x < px + pw) and (py <= y < py + ph)
-        if inside:
+        if not self._popup_open or self._popup is None or not self._popup.winfo_exists():
             return
-
-        bx, by = self._btn.winfo_rootx(), self._btn.winfo_rooty()
-        bw, bh = self._btn.winfo_width(), self._btn.winfo_height()
-        on_btn = (bx <= x < bx + bw) and (by <= y < by + bh)
-        if on_btn:
+        if self._popup_geom is None:
+            # not armed yet; this is the release of the click that opened the popup
             return
+        x, y = evt.x_root, evt.y_root
+        for geom in (self._popup_geom, self._btn_geom):
+            if geom is None:
+                continue
+            gx, gy, gw, gh = geom
+            if gx <= x < gx + gw and gy <= y < gy + gh:
+                return
 
         self._close_popup()
 
+    @staticmethod
+    def _root_geom(widget: tk.Misc) -> tuple[int, int, int, int]:
+        return widget.winfo_rootx(), widget.winfo_rooty(), widget.winfo_width(), widget.winfo_height()
+
+    def set_callbacks(
+        self,
+        on_select: Callable[[str], None],
+        custom: list[Colour | None] | None = None,
+        on_update_custom: Callable[[int, Colour | None], None] | None = None,
+    ) -> None:
+        """Point an existing palette at new callbacks and custom slots.
+
+        Args;
+            on_select: Callback when a colour is selected.
+            custom: Optional custom colours.
+            on_update_custom: Optional callback when custom colours change.
+        """
+        self._on_select = on_select
+        model = self._custom_model
+        if custom is not None and custom is not model.values:
+            model.values = custom
+            for pal in list(model.listeners):
+                pal._refresh_custom()
+        model.on_update = on_update_custom
+
     # ------- selection -------
     def _select(self, name: str) -> None:
         self._on_select(name)
@@ -265,27 +548,26 @@ class Colour_Palette(ttk.Frame):
 
     def _update_highlight(self, selected: str) -> None:
         try:
-            col = next((c for c in self._colours if c.hexah == selected), None) or Colours.parse_colour(selected)
-            if col.alpha == 0:
-                self._btn.itemconfigure(self._rect_id, fill="", stipple="")
-            else:
-                self._btn.itemconfigure(
-                    self._rect_id,
-                    fill=col.hexh,
-                    stipple=self._canvas._stipple_for_alpha(col.alpha) or "",
-                )
+            col = self._by_hexah.get(selected) or _parse_colour(selected)
+            if self._pending_colour is not None:
+                self._pending_colour = col
+                return
+            _draw_swatch(self._btn, col, outline=Colours.black.hexh)
         except Exception:
             pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Header_Handles:
     """Handles for the header bar widgets."""
 
     frame: ttk.Frame
+    buttons: tuple[ttk.Button, ...] = ()
+    radios: tuple[ttk.Radiobutton, ...] = ()
+    icon_label: ttk.Label | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Toolbar_Handles:
     """Handles for the toolbar widgets."""
 
@@ -301,6 +583,8 @@ class Toolbar_Handles:
     palette_bg: Palette_Handles
     palette_label: Palette_Handles
     palette_icon: Palette_Handles
+    style_trace: tuple[tk.StringVar, str] | None = None
+    "variable and trace id of the on_style_change callback"
 
 
 class Side(StrEnum):
@@ -311,20 +595,16 @@ class Side(StrEnum):
     right = "right"
 
 
-@dataclass(order=True)
+@dataclass(slots=True)
 class _Overlay:
     """Overlay entry for the status bar."""
 
-    sort_key: tuple[int, int] = field(init=False, repr=False)
     key: str
     text: str
     priority: int = 0
     side: Side = Side.left
     seq: int = 0
 
-    def __post_init__(self) -> None:
-        self.sort_key = (-self.priority, self.seq)
-
 
 class Status_Handles(ttk.Frame):
     """Status bar widget container."""
@@ -351,6 +631,10 @@ class Status_Handles(ttk.Frame):
 class Bars:
     """Factory helpers for UI bars."""
 
+    # one header/toolbar per master; repeat calls rewire the existing widgets
+    _built_headers: ClassVar[WeakKeyDictionary[tk.Misc, Header_Handles]] = WeakKeyDictionary()
+    _built_toolbars: ClassVar[WeakKeyDictionary[tk.Misc, Toolbar_Handles]] = WeakKeyDictionary()
+
     @classmethod
     def create_status(cls, master: tk.Misc, status: "Bars.Status") -> Status_Handles:
         """Create and pack the status bar.
@@ -364,24 +648,20 @@ class Bars:
         """
         strip = Status_Handles(master, status)
         strip.pack(fill="x", side="bottom")
+        status.attach(strip)
         return strip
 
     @staticmethod
-    def _add_labeled(
-        master: ttk.Frame,
-        make_widget: Callable[[ttk.Frame], TWidget],
-        text: str = "",
-        right_label: bool = False,
-    ) -> TWidget:
-        f = ttk.Frame(master)
-        if not right_label and text:
-            ttk.Label(f, text=text).pack(side="left")
-        w = make_widget(f)
-        w.pack(side="left")
-        if right_label and text:
-            ttk.Label(f, text=text).pack(side="left")
-        f.pack(side="left", padx=4)
-        return w
+    def _add(master: ttk.Frame, widget: tk.Widget, text: str = "", right_label: bool = False, *, column: int) -> int:
+        # label and widget sit in adjacent grid columns of master, no wrapper frame; returns the next free column
+        if not text:
+            widget.grid(row=0, column=column, padx=4)
+            return column + 1
+        lbl = ttk.Label(master, text=text)
+        first, second = (widget, lbl) if right_label else (lbl, widget)
+        first.grid(row=0, column=column, padx=(4, 0))
+        second.grid(row=0, column=column + 1, padx=(0, 4))
+        return column + 2
 
     @classmethod
     def create_palette(
@@ -439,30 +719,60 @@ class Bars:
         Returns;
             The header handles.
         """
+        # Actions
+        actions: tuple[tuple[str, Callable[[], object]], ...] = (
+            ("Grid (G)", on_toggle_grid),
+            ("Undo (Ctrl+Z)", on_undo),
+            ("Redo (Ctrl+Y)", on_redo),
+            ("Export…", on_export),
+            ("New", on_new),
+            ("Open…", on_open),
+            ("Save", on_save),
+            ("Save As…", on_save_as),
+            ("Settings…", on_settings),
+        )
+
+        existing = cls._built_headers.get(master)
+        if existing is not None and existing.frame.winfo_exists():
+            for btn, (_text, command) in zip(existing.buttons, actions):
+                btn.configure(command=command)
+            for rb in existing.radios:
+                rb.configure(variable=mode_var)
+            if existing.icon_label is not None and icon_label_var is not None:
+                existing.icon_label.configure(textvariable=icon_label_var)
+            return existing
+
+        # children are laid out in the unmapped frame; it is packed once everything exists
         frame = ttk.Frame(master)
-        frame.pack(fill="x", side="top")
 
-        # Actions
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Grid (G)", command=on_toggle_grid))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Undo (Ctrl+Z)", command=on_undo))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Redo (Ctrl+Y)", command=on_redo))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Export…", command=on_export))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="New", command=on_new))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Open…", command=on_open))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Save", command=on_save))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Save As…", command=on_save_as))
-        cls._add_labeled(frame, lambda p: ttk.Button(p, text="Settings…", command=on_settings))
+        buttons: list[ttk.Button] = []
+        for text, command in actions:
+            btn = ttk.Button(frame, text=text, command=command)
+            btn.pack(side="left", padx=4)
+            buttons.append(btn)
 
         # Modes
-        cls._add_labeled(frame, lambda p: ttk.Radiobutton(p, text="Select", value=Tool_Name.select, variable=mode_var))
-        cls._add_labeled(frame, lambda p: ttk.Radiobutton(p, text="Draw", value=Tool_Name.draw, variable=mode_var))
-        cls._add_labeled(frame, lambda p: ttk.Radiobutton(p, text="Label", value=Tool_Name.label, variable=mode_var))
-        cls._add_labeled(frame, lambda p: ttk.Radiobutton(p, text="Icon", value=Tool_Name.icon, variable=mode_var))
+        modes = (
+            ("Select", Tool_Name.select),
+            ("Draw", Tool_Name.draw),
+            ("Label", Tool_Name.label),
+            ("Icon", Tool_Name.icon),
+        )
+        radios: list[ttk.Radiobutton] = []
+        for text, value in modes:
+            rb = ttk.Radiobutton(frame, text=text, value=value, variable=mode_var)
+            rb.pack(side="left", padx=4)
+            radios.append(rb)
 
+        icon_label = None
         if icon_label_var is not None:
-            cls._add_labeled(frame, lambda p: ttk.Label(p, textvariable=icon_label_var), "")
+            icon_label = ttk.Label(frame, textvariable=icon_label_var)
+            icon_label.pack(side="left", padx=4)
 
-        return Header_Handles(frame=frame)
+        handles = Header_Handles(frame=frame, buttons=tuple(buttons), radios=tuple(radios), icon_label=icon_label)
+        frame.pack(fill="x", side="top")
+        cls._built_headers[master] = handles
+        return handles
 
     @classmethod
     def create_toolbar(
@@ -511,147 +821,125 @@ class Bars:
         Returns;
             The toolbar handles.
         """
+        # spinbox bumps and trace writes arrive in bursts; only the last one in a burst needs handling, while
+        # explicit commits (Return/FocusOut) go through .now() so a following shortcut sees the applied value
+        on_grid_change = _Debounced(master, on_grid_change)
+        on_brush_change = _Debounced(master, on_brush_change)
+        on_canvas_size_change = _Debounced(master, on_canvas_size_change)
+        on_style_change = _Debounced(master, on_style_change)
+
+        existing = cls._built_toolbars.get(master)
+        if existing is not None and existing.frame.winfo_exists():
+            cls._rewire_toolbar(
+                existing,
+                spin_vars=(grid_var, brush_var, width_var, height_var),
+                drag_to_draw_var=drag_to_draw_var,
+                cardinal_var=cardinal_var,
+                style_var=style_var,
+                on_grid_change=on_grid_change,
+                on_brush_change=on_brush_change,
+                on_canvas_size_change=on_canvas_size_change,
+                on_style_change=on_style_change,
+                palette_selects=(
+                    on_palette_select_brush,
+                    on_palette_select_bg,
+                    on_palette_select_label,
+                    on_palette_select_icon,
+                ),
+                custom_palette=custom_palette,
+                on_update_custom=on_update_custom,
+            )
+            return existing
+
+        # children are laid out in the unmapped frame; it is packed once everything exists
         frame = ttk.Frame(master)
-        frame.pack(fill="x", side="top")
 
-        sbox_grid = cls._add_labeled(
+        sbox_grid = Composite_Spinbox(
             frame,
-            lambda p: Composite_Spinbox(
-                p,
-                from_=0,
-                to=200,
-                increment=5,
-                width=3,
-                textvariable=grid_var,
-                command=on_grid_change,
-            ),
-            "Grid:",
+            from_=0,
+            to=200,
+            increment=5,
+            width=3,
+            textvariable=grid_var,
+            command=on_grid_change,
+            commit_command=on_grid_change.now,
         )
-        sbox_brush = cls._add_labeled(
+        sbox_brush = Composite_Spinbox(
             frame,
-            lambda p: Composite_Spinbox(
-                p,
-                from_=1,
-                to=50,
-                increment=1,
-                width=3,
-                textvariable=brush_var,
-                command=on_brush_change,
-            ),
-            "Line:",
+            from_=1,
+            to=50,
+            increment=1,
+            width=3,
+            textvariable=brush_var,
+            command=on_brush_change,
+            commit_command=on_brush_change.now,
         )
-        sbox_w = cls._add_labeled(
+        sbox_w = Composite_Spinbox(
             frame,
-            lambda p: Composite_Spinbox(
-                p,
-                from_=100,
-                to=10000,
-                increment=50,
-                width=4,
-                textvariable=width_var,
-                command=on_canvas_size_change,
-            ),
-            "W:",
+            from_=100,
+            to=10000,
+            increment=50,
+            width=4,
+            textvariable=width_var,
+            command=on_canvas_size_change,
+            commit_command=on_canvas_size_change.now,
         )
-        sbox_h = cls._add_labeled(
+        sbox_h = Composite_Spinbox(
             frame,
-            lambda p: Composite_Spinbox(
-                p,
-                from_=100,
-                to=10000,
-                increment=50,
-                width=4,
-                textvariable=height_var,
-                command=on_canvas_size_change,
-            ),
-            "H:",
+            from_=100,
+            to=10000,
+            increment=50,
+            width=4,
+            textvariable=height_var,
+            command=on_canvas_size_change,
+            commit_command=on_canvas_size_change.now,
+        )
+        cbut_dtd = ttk.Checkbutton(frame, variable=drag_to_draw_var)
+        cbut_cardinal = ttk.Checkbutton(frame, variable=cardinal_var)
+        cb_style = ttk.Combobox(
+            frame, values=_SORTED_LINE_STYLES, state="readonly", width=9, textvariable=style_var, height=16
         )
+        style_trace = style_var.trace_add("write", lambda *_: on_style_change())
 
-        cbut_dtd = cls._add_labeled(
-            frame,
-            lambda p: ttk.Checkbutton(
-                p,
-                variable=drag_to_draw_var,
-            ),
-            "Drag to draw:",
+        # one model for all four palettes, so a custom slot edited in one is redrawn in the others
+        custom_model = Custom_Palette_Model(
+            custom_palette if custom_palette is not None else [None] * len(_COLOURS_ALL), on_update_custom
         )
-        cbut_cardinal = cls._add_labeled(
-            frame,
-            lambda p: ttk.Checkbutton(
-                p,
-                variable=cardinal_var,
-            ),
-            "Cardinal:",
+        palettes = tuple(
+            Colour_Palette(frame, colours, on_select=on_sel, custom_model=custom_model)
+            for colours, on_sel in (
+                (_COLOURS_MIN25, on_palette_select_brush),
+                (_COLOURS_ALL, on_palette_select_bg),
+                (_COLOURS_MIN25, on_palette_select_label),
+                (_COLOURS_MIN25, on_palette_select_icon),
+            )
         )
-        styles = [s.value for s in LineStyle]
-        cb_style = cls._add_labeled(
-            frame,
-            lambda p: ttk.Combobox(
-                p,
-                values=sorted(styles, key=str.lower),
-                state="readonly",
-                width=9,
-                textvariable=style_var,
-                height=16,
-            ),
-            "Style:",
+        pal_brush, pal_bg, pal_label, pal_icon = (
+            Palette_Handles(frame=pal, set_selected=pal._update_highlight) for pal in palettes
         )
-        style_var.trace_add("write", lambda *_: on_style_change())
-
-        def _make_brush(p: ttk.Frame) -> Colour_Palette:
-            return Colour_Palette(
-                p,
-                Colours.list(min_alpha=25),
-                on_select=on_palette_select_brush,
-                custom=custom_palette,
-                on_update_custom=on_update_custom,
-            )
-
-        brush_widget = cls._add_labeled(frame, _make_brush, "Brush:")
-        pal_brush = Palette_Handles(frame=brush_widget, set_selected=brush_widget._update_highlight)
-
-        def _make_bg(p: ttk.Frame) -> Colour_Palette:
-            return Colour_Palette(
-                p,
-                Colours.list(),
-                on_select=on_palette_select_bg,
-                custom=custom_palette,
-                on_update_custom=on_update_custom,
-            )
-
-        bg_widget = cls._add_labeled(frame, _make_bg, "BG:")
-        pal_bg = Palette_Handles(frame=bg_widget, set_selected=bg_widget._update_highlight)
-
-        def _make_label(p: ttk.Frame) -> Colour_Palette:
-            return Colour_Palette(
-                p,
-                Colours.list(min_alpha=25),
-                on_select=on_palette_select_label,
-                custom=custom_palette,
-                on_update_custom=on_update_custom,
-            )
-
-        lb_widget = cls._add_labeled(frame, _make_label, "Label:")
-        pal_label = Palette_Handles(frame=lb_widget, set_selected=lb_widget._update_highlight)
 
-        def _make_icon(p: ttk.Frame) -> Colour_Palette:
-            return Colour_Palette(
-                p,
-                Colours.list(min_alpha=25),
-                on_select=on_palette_select_icon,
-                custom=custom_palette,
-                on_update_custom=on_update_custom,
-            )
-
-        ic_widget = cls._add_labeled(frame, _make_icon, "Icon:")
-        pal_icon = Palette_Handles(frame=ic_widget, set_selected=ic_widget._update_highlight)
-
-        sbox_grid.bind("<Return>", lambda _e: on_grid_change())
-        sbox_brush.bind("<Return>", lambda _e: on_brush_change())
-        sbox_w.bind("<Return>", lambda _e: on_canvas_size_change())
-        sbox_h.bind("<Return>", lambda _e: on_canvas_size_change())
-
-        return Toolbar_Handles(
+        col = 0
+        for widget, text in (
+            (sbox_grid, "Grid:"),
+            (sbox_brush, "Line:"),
+            (sbox_w, "W:"),
+            (sbox_h, "H:"),
+            (cbut_dtd, "Drag to draw:"),
+            (cbut_cardinal, "Cardinal:"),
+            (cb_style, "Style:"),
+            (palettes[0], "Brush:"),
+            (palettes[1], "BG:"),
+            (palettes[2], "Label:"),
+            (palettes[3], "Icon:"),
+        ):
+            col = cls._add(frame, widget, text, column=col)
+
+        sbox_grid.bind("<Return>", lambda _e: on_grid_change.now())
+        sbox_brush.bind("<Return>", lambda _e: on_brush_change.now())
+        sbox_w.bind("<Return>", lambda _e: on_canvas_size_change.now())
+        sbox_h.bind("<Return>", lambda _e: on_canvas_size_change.now())
+
+        handles = Toolbar_Handles(
             frame=frame,
             spin_grid=sbox_grid,
             spin_brush=sbox_brush,
@@ -664,7 +952,48 @@ class Bars:
             palette_bg=pal_bg,
             palette_label=pal_label,
             palette_icon=pal_icon,
+            style_trace=(style_var, style_trace),
         )
+        frame.pack(fill="x", side="top")
+        cls._built_toolbars[master] = handles
+        return handles
+
+    @staticmethod
+    def _rewire_toolbar(
+        handles: Toolbar_Handles,
+        *,
+        spin_vars: tuple[tk.IntVar, tk.IntVar, tk.IntVar, tk.IntVar],
+        drag_to_draw_var: tk.BooleanVar,
+        cardinal_var: tk.BooleanVar,
+        style_var: tk.StringVar,
+        on_grid_change: _Debounced,
+        on_brush_change: _Debounced,
+        on_canvas_size_change: _Debounced,
+        on_style_change: _Debounced,
+        palette_selects: tuple[Callable[[str], None], ...],
+        custom_palette: list[Colour | None] | None,
+        on_update_custom: Callable[[int, Colour | None], None] | None,
+    ) -> None:
+        spins = (handles.spin_grid, handles.spin_brush, handles.spin_w, handles.spin_h)
+        commands = (on_grid_change, on_brush_change, on_canvas_size_change, on_canvas_size_change)
+        for sbox, var, command in zip(spins, spin_vars, commands):
+            if sbox.var is not var:
+                sbox.var = var
+                sbox.entry.configure(textvariable=var)
+            sbox.configure(command=command, commit_command=command.now)
+            sbox.bind("<Return>", lambda _e, command=command: command.now())
+
+        handles.cb_dtd.configure(variable=drag_to_draw_var)
+        handles.cb_cardinal.configure(variable=cardinal_var)
+        handles.cb_style.configure(textvariable=style_var)
+        if handles.style_trace is not None:
+            old_var, old_trace = handles.style_trace
+            old_var.trace_remove("write", old_trace)
+        handles.style_trace = (style_var, style_var.trace_add("write", lambda *_: on_style_change()))
+
+        palettes = (handles.palette_brush, handles.palette_bg, handles.palette_label, handles.palette_icon)
+        for pal, on_sel in zip(palettes, palette_selects):
+            pal.frame.set_callbacks(on_sel, custom=custom_palette, on_update_custom=on_update_custom)
 
     class Status:
         """Status bar state and overlay management."""
@@ -684,11 +1013,22 @@ class Bars:
             self._seq = 0
 
             self._held: dict[str, _Overlay] = {}
+            # heap entries are (-priority, seq, overlay); seq is unique so overlays are never compared
+            self._by_side: dict[Side, list[tuple[int, int, _Overlay]]] = {s: [] for s in Side}
             self._temp_key: str | None = None
             self._temp_after: str | None = None
+            self._temp_deadline = 0.0
+            self._temp_fire_at = 0.0
+            self._hold_expiry: dict[str, float] = {}
+            self._gc_after: str | None = None
 
             self._centre_key = "__centre__"
 
+            self._render_pending = False
+            self._last: tuple[str, str, str] = ("Ready", "", "")
+            self._handles: Status_Handles | None = None
+            self._visible = True
+
         # ---- base ----
         def set(self, text: str) -> None:
             """Set the base left status text.
@@ -696,6 +1036,8 @@ class Bars:
             Args;
                 text: The status text.
             """
+            if text == self._base_left:
+                return
             self._base_left = text
             self._render()
 
@@ -716,7 +1058,9 @@ class Bars:
             self.release(self._centre_key)
 
         # ---- held overlays (persistent until release) ----
-        def hold(self, key: str, text: str, *, priority: int = 0, side: Side = Side.left) -> None:
+        def hold(
+            self, key: str, text: str, *, priority: int = 0, side: Side = Side.left, max_age: float | None = None
+        ) -> None:
             """Hold an overlay until released.
 
             Args;
@@ -724,23 +1068,59 @@ class Bars:
                 text: Overlay text.
                 priority: Higher values win.
                 side: Which side to display on.
+                max_age: Seconds after the last hold before the overlay is released automatically.
             """
+            if max_age is None:
+                self._hold_expiry.pop(key, None)
+            else:
+                self._hold_expiry[key] = monotonic() + max_age
+                if self._gc_after is None:
+                    self._gc_after = self._root.after(1000, self._gc_holds)
+            ov = self._held.get(key)
+            if ov is not None and ov.text == text and ov.priority == priority and ov.side == side:
+                return
             self._seq += 1
-            self._held[key] = _Overlay(key=key, text=text, priority=priority, side=side, seq=self._seq)
+            if ov is None:
+                ov = self._held[key] = _Overlay(key=key, text=text, priority=priority, side=side, seq=self._seq)
+            else:
+                # re-held keys (temp, pointer position) reuse their overlay; the old heap entry goes stale via seq
+                ov.text, ov.priority, ov.side, ov.seq = text, priority, side, self._seq
+            heap = self._by_side[side]
+            heapq.heappush(heap, (-priority, self._seq, ov))
+            if len(heap) > MAX_STALE_OVERLAYS:
+                # replaced/released entries buried under a live top never get popped
+                heap[:] = [e for e in heap if self._is_live(e)]
+                heapq.heapify(heap)
             self._render()
 
+        def _is_live(self, entry: tuple[int, int, _Overlay]) -> bool:
+            ov = entry[2]
+            return ov.seq == entry[1] and self._held.get(ov.key) is ov
+
         def release(self, key: str) -> None:
             """Release a held overlay.
 
             Args;
                 key: Overlay identifier.
             """
+            self._hold_expiry.pop(key, None)
             if key in self._held:
                 del self._held[key]
+                if not self._held:
+                    for heap in self._by_side.values():
+                        heap.clear()
                 if self._temp_key == key:
                     self._temp_key = None
                 self._render()
 
+        def _gc_holds(self) -> None:
+            self._gc_after = None
+            now = monotonic()
+            for key in [k for k, t in self._hold_expiry.items() if t <= now]:
+                self.release(key)
+            if self._hold_expiry:
+                self._gc_after = self._root.after(1000, self._gc_holds)
+
         # ---- temporary overlays (auto-clear) ----
         def temp(self, text: str, ms: int = 1500, *, priority: int = 50, side: Side = Side.centre) -> None:
             """Show a temporary overlay.
@@ -751,19 +1131,32 @@ class Bars:
                 priority: Priority of the overlay.
                 side: Which side to display on.
             """
-            # cancel previous timer
-            if self._temp_after:
+            # temp overlay is just a special held
+            key = "__temp__"
+            self.hold(key, text, priority=priority, side=side)
+            self._temp_key = key
+
+            # one timer per burst: later temps only move the deadline, and the tick re-arms for what is left
+            now = monotonic()
+            self._temp_deadline = now + ms / 1000
+            if self._temp_after is not None and self._temp_deadline < self._temp_fire_at:
                 try:
                     self._root.after_cancel(self._temp_after)
                 except Exception:
                     pass
                 self._temp_after = None
+            if self._temp_after is None:
+                self._temp_fire_at = self._temp_deadline
+                self._temp_after = self._root.after(ms, self._temp_tick)
 
-            # temp overlay is just a special held
-            key = "__temp__"
-            self.hold(key, text, priority=priority, side=side)
-            self._temp_key = key
-            self._temp_after = self._root.after(ms, self._clear_temp)
+        def _temp_tick(self) -> None:
+            self._temp_after = None
+            remaining = self._temp_deadline - monotonic()
+            if remaining > 0.001:
+                self._temp_fire_at = self._temp_deadline
+                self._temp_after = self._root.after(max(1, round(remaining * 1000)), self._temp_tick)
+                return
+            self._clear_temp()
 
         def _clear_temp(self) -> None:
             if self._temp_key:
@@ -775,6 +1168,15 @@ class Bars:
             """Clear all status text and overlays."""
             self._base_left = ""
             self._held.clear()
+            for heap in self._by_side.values():
+                heap.clear()
+            self._hold_expiry.clear()
+            if self._gc_after:
+                try:
+                    self._root.after_cancel(self._gc_after)
+                except Exception:
+                    pass
+                self._gc_after = None
             if self._temp_after:
                 try:
                     self._root.after_cancel(self._temp_after)
@@ -784,16 +1186,53 @@ class Bars:
             self._temp_key = None
             self._render()
 
+        def attach(self, handles: Status_Handles) -> None:
+            """Attach the status bar widget so renders can pause while it is hidden.
+
+            Args;
+                handles: The status bar created for this status.
+            """
+            self._handles = handles
+            self._visible = bool(handles.winfo_ismapped())
+            handles.bind("<Map>", self._on_map, add="+")
+            handles.bind("<Unmap>", self._on_unmap, add="+")
+
+        def _on_map(self, _evt: tk.Event | None = None) -> None:
+            self._visible = True
+            self._render()
+
+        def _on_unmap(self, _evt: tk.Event | None = None) -> None:
+            self._visible = False
+
         # ---- render ----
         def _render(self) -> None:
-            self.var_left.set(self._pick_side(Side.left) or self._base_left)
-            self.var_centre.set(self._pick_side(Side.centre) or "")
-            self.var_right.set(self._pick_side(Side.right) or "")
+            # coalesce bursts of hold/release/set into one var update per idle; while the bar is hidden
+            # state still updates but nothing is pushed to Tk until it is mapped again
+            if self._visible and not self._render_pending:
+                self._render_pending = True
+                self._root.after_idle(self._do_render)
+
+        def _do_render(self) -> None:
+            self._render_pending = False
+            if self._held:
+                left = self._pick_side(Side.left) or self._base_left
+                centre = self._pick_side(Side.centre)
+                right = self._pick_side(Side.right)
+            else:
+                # nothing held: the common case, heaps were emptied by release/clear
+                left, centre, right = self._base_left, "", ""
+            last_left, last_centre, last_right = self._last
+            if left != last_left:
+                self.var_left.set(left)
+            if centre != last_centre:
+                self.var_centre.set(centre)
+            if right != last_right:
+                self.var_right.set(right)
+            self._last = (left, centre, right)
 
         def _pick_side(self, side: Side) -> str:
-            # choose the highest-priority overlay on this side
-            items = [ov for ov in self._held.values() if ov.side == side]
-            if not items:
-                return ""
-            top = sorted(items)[0]  # because sort_key is (-priority, seq)
-            return top.text
+            # heap top is the highest-priority overlay; drop entries released or replaced since they were pushed
+            heap = self._by_side[side]
+            while heap and not self._is_live(heap[0]):
+                heapq.heappop(heap)
+            return heap[0][2].text if heap else ""
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import colorsys
 import tkinter as tk
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from tkinter import ttk
 
-from PIL import Image, ImageTk
+from PIL import Image, ImageChops, ImageColor, ImageTk
 
 from models.geo import CanvasLW
 from models.styling import Colour, Colours
@@ -25,6 +27,18 @@ class _PickerState:
     v: float
 
 
+@lru_cache(maxsize=8)
+def _checker_pil(w: int, h: int, tile: int, a: str, b: str) -> Image.Image:
+    # identical for every dialog; only the per-root PhotoImage wrapper has to be rebuilt.
+    # one pixel per tile, then a single NEAREST upscale does the tiling in C
+    cols = -(-w // tile)
+    rows = -(-h // tile)
+    ca, cb = bytes(ImageColor.getrgb(a)), bytes(ImageColor.getrgb(b))
+    buf = b"".join(cb if (x + y) % 2 == 0 else ca for y in range(rows) for x in range(cols))
+    cells = Image.frombytes("RGB", (cols, rows), buf)
+    return cells.resize((cols * tile, rows * tile), Image.Resampling.NEAREST).crop((0, 0, w, h))
+
+
 def _checker_photo(
     master: tk.Misc,
     w: int = 20,
@@ -33,12 +47,85 @@ def _checker_photo(
     a: str = "#eeeeee",
     b: str = "#cccccc",
 ) -> ImageTk.PhotoImage:
-    img = Image.new("RGB", (w, h), a)
-    for y in range(0, h, tile):
-        start = ((y // tile) % 2) * tile
-        for x in range(start, w, tile * 2):
-            Image.Image.paste(img, b, (x, y, x + tile, y + tile))
-    return ImageTk.PhotoImage(img, master=master)
+    return ImageTk.PhotoImage(_checker_pil(w, h, tile, a, b), master=master)
+
+
+# the strips are small enough that Tk's own "{#rrggbb ...} ..." put format beats a PIL round trip
+def _put_rows(rows: list[list[tuple[int, int, int]]]) -> str:
+    return " ".join("{" + " ".join(f"#{r:02x}{g:02x}{b:02x}" for r, g, b in row) + "}" for row in rows)
+
+
+@lru_cache(maxsize=4)
+def _hue_strip_data(w: int, h: int) -> str:
+    last = max(1, w - 1)
+    row = [_hsv_to_rgb(x / last, 1.0, 1.0) for x in range(w)]
+    return _put_rows([row] * h)
+
+
+@lru_cache(maxsize=64)
+def _alpha_strip_data(rgb: tuple[int, int, int], w: int, h: int, tile: int = 4) -> str:
+    # colour ramped 0->255 alpha over the same light/dark checker as the preview
+    last = max(1, w - 1)
+    blended: dict[int, list[tuple[int, int, int]]] = {}
+    for bg in (0xEE, 0xCC):
+        out = []
+        for x in range(w):
+            a = round(255 * x / last) / 255.0
+            out.append(tuple(round(c * a + bg * (1.0 - a)) for c in rgb))
+        blended[bg] = out
+    rows = []
+    for y in range(h):
+        odd_row = (y // tile) % 2
+        rows.append([blended[0xCC if (x // tile) % 2 == odd_row else 0xEE][x] for x in range(w)])
+    return _put_rows(rows)
+
+
+@lru_cache(maxsize=4)
+def _value_shade(size: int) -> Image.Image:
+    # the value ramp doesn't depend on hue, so it is stretched once per size
+    last = max(1, size - 1)
+    col = Image.frombytes("L", (1, size), bytes(round(255 * (1.0 - y / last)) for y in range(size)))
+    return col.resize((size, size), Image.Resampling.NEAREST).convert("RGB")
+
+
+def _sv_square_image(hue: float, size: int) -> Image.Image:
+    # hsv_to_rgb(h, s, v) == v * lerp(white, pure hue, s) per channel, so the square is a horizontal
+    # white->hue ramp multiplied by a vertical value ramp; both ramps are one pixel thick and stretched in C
+    pure = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+    last = max(1, size - 1)
+    buf = bytes(round(255 * (1.0 - (x / last) * (1.0 - p))) for x in range(size) for p in pure)
+    row = Image.frombytes("RGB", (size, 1), buf)
+    return ImageChops.multiply(row.resize((size, size), Image.Resampling.NEAREST), _value_shade(size))
+
+
+# conversions are pure and their inputs are quantised (0-255 channels, pixel positions on the
+# canvases), so drags and spin edits keep hitting the same few thousand keys
+@lru_cache(maxsize=4096)
+def _rgb_to_hsv(r: int, g: int, b: int) -> tuple[float, float, float]:
+    # integer form of colorsys.rgb_to_hsv; the /255 scale cancels out of s and h
+    hi = max(r, g, b)
+    delta = hi - min(r, g, b)
+    v = hi / 255.0
+    if delta == 0:
+        return 0.0, 0.0, v
+    if hi == r:
+        h = (g - b) / delta
+    elif hi == g:
+        h = 2.0 + (b - r) / delta
+    else:
+        h = 4.0 + (r - g) / delta
+    return (h / 6.0) % 1.0, delta / hi, v
+
+
+@lru_cache(maxsize=4096)
+def _hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
+    # branchless per channel: c = v * lerp(1, clamp(|frac(h + k) * 6 - 3| - 1, 0, 1), s)
+    def _chan(k: float) -> int:
+        p = abs(((h + k) % 1.0) * 6.0 - 3.0) - 1.0
+        p = 0.0 if p < 0.0 else 1.0 if p > 1.0 else p
+        return int(round(255 * v * (1.0 - s + s * p)))
+
+    return _chan(1.0), _chan(2.0 / 3.0), _chan(1.0 / 3.0)
 
 
 def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
@@ -57,7 +144,7 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
     top.transient(master.winfo_toplevel())
 
     base = initial or Colours.white
-    h0, s0, v0 = colorsys.rgb_to_hsv(base.red / 255.0, base.green / 255.0, base.blue / 255.0)
+    h0, s0, v0 = _rgb_to_hsv(base.red, base.green, base.blue)
 
     state = _PickerState(
         r=base.red,
@@ -101,13 +188,6 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
             return high
         return fv
 
-    def _rgb_to_hsv(r: int, g: int, b: int) -> tuple[float, float, float]:
-        return colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
-
-    def _hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return int(round(r * 255)), int(round(g * 255)), int(round(b * 255))
-
     def _parse_hex() -> Colour | None:
         raw = hex_var.get().strip()
         if not raw:
@@ -134,8 +214,6 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
         if a is None:
             a = state.a
         a = _clamp_int(a)
-        old_h = state.h
-        old_rgb = (state.r, state.g, state.b)
         h, s, v = _rgb_to_hsv(r, g, b)
         state.r = r
         state.g = g
@@ -144,7 +222,7 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
         state.h = h
         state.s = s
         state.v = v
-        _sync_ui(update_sv=abs(h - old_h) > 1e-6, update_alpha_strip=(r, g, b) != old_rgb)
+        _sync_ui(update_sv=_sv_stale(h), update_alpha_strip=_alpha_stale(r, g, b))
         updating = False
 
     def _set_state_from_hsv(h: float, s: float, v: float) -> None:
@@ -155,8 +233,6 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
         h = _clamp_float(h)
         s = _clamp_float(s)
         v = _clamp_float(v)
-        old_h = state.h
-        old_rgb = (state.r, state.g, state.b)
         r, g, b = _hsv_to_rgb(h, s, v)
         state.r = r
         state.g = g
@@ -164,7 +240,7 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
         state.h = h
         state.s = s
         state.v = v
-        _sync_ui(update_sv=abs(h - old_h) > 1e-6, update_alpha_strip=(r, g, b) != old_rgb)
+        _sync_ui(update_sv=_sv_stale(h), update_alpha_strip=_alpha_stale(r, g, b))
         updating = False
 
     def _set_alpha(a: int) -> None:
@@ -185,10 +261,12 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
             top.bell()
             return
         _set_state_from_rgb(col.red, col.green, col.blue, col.alpha)
+        # _sync_ui leaves the entry alone when the colour is unchanged; still normalise what was typed
+        hex_var.set(_current_colour().hexah)
 
     def _on_ok() -> None:
         nonlocal result
-        result = Colour(red=state.r, green=state.g, blue=state.b, alpha=state.a)
+        result = _current_colour()
         top.destroy()
 
     def _on_cancel() -> None:
@@ -314,46 +392,14 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
     alpha_marker_outer = alpha_canvas.create_line(0, 0, 0, STRIP_H, fill="white", width=3)
     alpha_marker_inner = alpha_canvas.create_line(0, 0, 0, STRIP_H, fill="black", width=1)
 
-    def _checker_image(w: int, h: int, tile: int = 6) -> Image.Image:
-        img = Image.new("RGB", (w, h), "#EEEEEE")
-        for y in range(0, h, tile):
-            start = ((y // tile) % 2) * tile
-            for x in range(start, w, tile * 2):
-                Image.Image.paste(img, "#CCCCCC", (x, y, x + tile, y + tile))
-        return img
-
-    def _sv_square_photo(hue: float) -> ImageTk.PhotoImage:
-        img = Image.new("RGB", (SV_SIZE, SV_SIZE))
-        for y in range(SV_SIZE):
-            v = 1.0 - (y / (SV_SIZE - 1) if SV_SIZE > 1 else 0.0)
-            for x in range(SV_SIZE):
-                s = x / (SV_SIZE - 1) if SV_SIZE > 1 else 0.0
-                r, g, b = colorsys.hsv_to_rgb(hue, s, v)
-                img.putpixel((x, y), (int(round(r * 255)), int(round(g * 255)), int(round(b * 255))))
-        return ImageTk.PhotoImage(img, master=top)
-
-    def _hue_strip_photo() -> ImageTk.PhotoImage:
-        img = Image.new("RGB", (STRIP_W, STRIP_H))
-        for x in range(STRIP_W):
-            h = x / (STRIP_W - 1) if STRIP_W > 1 else 0.0
-            r, g, b = colorsys.hsv_to_rgb(h, 1.0, 1.0)
-            col = (int(round(r * 255)), int(round(g * 255)), int(round(b * 255)))
-            for y in range(STRIP_H):
-                img.putpixel((x, y), col)
-        return ImageTk.PhotoImage(img, master=top)
-
-    def _alpha_strip_photo(col: Colour) -> ImageTk.PhotoImage:
-        base_img = _checker_image(STRIP_W, STRIP_H, tile=4).convert("RGBA")
-        overlay = Image.new("RGBA", (STRIP_W, STRIP_H))
-        for x in range(STRIP_W):
-            a = int(round(255 * (x / (STRIP_W - 1) if STRIP_W > 1 else 1.0)))
-            for y in range(STRIP_H):
-                overlay.putpixel((x, y), (col.red, col.green, col.blue, a))
-        comp = Image.alpha_composite(base_img, overlay)
-        return ImageTk.PhotoImage(comp, master=top)
-
-    sv_photo: ImageTk.PhotoImage | None = None
-    alpha_photo: ImageTk.PhotoImage | None = None
+    # one Tk image each for the whole dialog; updates overwrite pixels rather than reallocating
+    sv_photo = ImageTk.PhotoImage("RGB", (SV_SIZE, SV_SIZE), master=top)
+    alpha_photo = tk.PhotoImage(master=top, width=STRIP_W, height=STRIP_H)
+    hue_photo = tk.PhotoImage(master=top, width=STRIP_W, height=STRIP_H)
+    hue_photo.put(_hue_strip_data(STRIP_W, STRIP_H))
+    hue_canvas.create_image(0, 0, image=hue_photo, anchor="nw")
+    sv_canvas.itemconfigure(sv_img_id, image=sv_photo)
+    alpha_canvas.itemconfigure(alpha_img_id, image=alpha_photo)
 
     hue_marker_outer = hue_canvas.create_line(0, 0, 0, STRIP_H, fill="white", width=3)
     hue_marker_inner = hue_canvas.create_line(0, 0, 0, STRIP_H, fill="black", width=1)
@@ -368,15 +414,42 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
                 stipple=CanvasLW._stipple_for_alpha(col.alpha) or "",
             )
 
+    # what the images currently show; changes smaller than a pixel's worth of hue or one LSB per channel
+    # are invisible at these sizes, and comparing against the shown value keeps small steps from drifting
+    shown_h: float | None = None
+    shown_rgb: tuple[int, int, int] | None = None
+
+    def _sv_stale(h: float) -> bool:
+        return shown_h is None or abs(h - shown_h) > 1.0 / SV_SIZE
+
+    def _alpha_stale(r: int, g: int, b: int) -> bool:
+        return shown_rgb is None or max(abs(r - shown_rgb[0]), abs(g - shown_rgb[1]), abs(b - shown_rgb[2])) > 1
+
     def _update_sv_image(hue: float) -> None:
-        nonlocal sv_photo
-        sv_photo = _sv_square_photo(hue)
-        sv_canvas.itemconfigure(sv_img_id, image=sv_photo)
+        nonlocal shown_h
+        shown_h = hue
+        sv_photo.paste(_sv_square_image(hue, SV_SIZE))
 
     def _update_alpha_strip(col: Colour) -> None:
-        nonlocal alpha_photo
-        alpha_photo = _alpha_strip_photo(col)
-        alpha_canvas.itemconfigure(alpha_img_id, image=alpha_photo)
+        nonlocal shown_rgb
+        shown_rgb = (col.red, col.green, col.blue)
+        alpha_photo.put(_alpha_strip_data(shown_rgb, STRIP_W, STRIP_H))
+
+    # image rebuilds are deferred to at most one per frame; drags only move markers synchronously
+    sv_after: str | None = None
+    alpha_after: str | None = None
+
+    def _flush_sv() -> None:
+        nonlocal sv_after
+        sv_after = None
+        if top.winfo_exists():
+            _update_sv_image(state.h)
+
+    def _flush_alpha() -> None:
+        nonlocal alpha_after
+        alpha_after = None
+        if top.winfo_exists():
+            _update_alpha_strip(_current_colour())
 
     def _move_sv_marker() -> None:
         x = int(round(state.s * (SV_SIZE - 1))) if SV_SIZE > 1 else 0
@@ -398,21 +471,35 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
         alpha_canvas.coords(alpha_marker_outer, x, 0, x, STRIP_H)
         alpha_canvas.coords(alpha_marker_inner, x, 0, x, STRIP_H)
 
+    # Colour is a validated model; build one only when the RGBA it wraps actually changes
+    col_cache: Colour | None = None
+
+    def _current_colour() -> Colour:
+        nonlocal col_cache
+        c = col_cache
+        if c is None or (c.red, c.green, c.blue, c.alpha) != (state.r, state.g, state.b, state.a):
+            c = col_cache = Colour(red=state.r, green=state.g, blue=state.b, alpha=state.a)
+        return c
+
     def _sync_ui(*, update_sv: bool, update_alpha_strip: bool) -> None:
-        col = Colour(red=state.r, green=state.g, blue=state.b, alpha=state.a)
-        _update_preview(col)
-        hex_var.set(col.hexah)
-        spin_r.set(state.r)
-        spin_g.set(state.g)
-        spin_b.set(state.b)
-        spin_a.set(state.a)
+        nonlocal sv_after, alpha_after
+        # hue/saturation moves at the black or grey edge leave RGBA alone; only the markers need updating
+        prev = col_cache
+        col = _current_colour()
+        if col is not prev:
+            _update_preview(col)
+            hex_var.set(col.hexah)
+            spin_r.set_silent(state.r)
+            spin_g.set_silent(state.g)
+            spin_b.set_silent(state.b)
+            spin_a.set_silent(state.a)
         _move_sv_marker()
         _move_hue_marker()
         _move_alpha_marker()
-        if update_sv:
-            _update_sv_image(state.h)
-        if update_alpha_strip:
-            _update_alpha_strip(col)
+        if update_sv and sv_after is None:
+            sv_after = top.after(16, _flush_sv)
+        if update_alpha_strip and alpha_after is None:
+            alpha_after = top.after(16, _flush_alpha)
 
     def _on_sv_event(e: tk.Event) -> None:
         x = max(0, min(SV_SIZE - 1, e.x))
@@ -431,12 +518,31 @@ def ask_colour(master: tk.Misc, initial: Colour | None = None) -> Colour | None:
         a = int(round(255 * (x / (STRIP_W - 1) if STRIP_W > 1 else 1.0)))
         _set_alpha(a)
 
+    def _coalesce(handler: Callable[[tk.Event], None]) -> Callable[[tk.Event], None]:
+        # motion can outpace redraws; only the latest event per idle cycle is applied
+        latest: tk.Event | None = None
+
+        def _run() -> None:
+            nonlocal latest
+            e, latest = latest, None
+            if e is not None and top.winfo_exists():
+                handler(e)
+
+        def _queue(e: tk.Event) -> None:
+            nonlocal latest
+            if latest is None:
+                top.after_idle(_run)
+            latest = e
+
+        return _queue
+
+    # clicks apply immediately, drags are coalesced
     sv_canvas.bind("<Button-1>", _on_sv_event)
-    sv_canvas.bind("<B1-Motion>", _on_sv_event)
+    sv_canvas.bind("<B1-Motion>", _coalesce(_on_sv_event))
     hue_canvas.bind("<Button-1>", _on_hue_event)
-    hue_canvas.bind("<B1-Motion>", _on_hue_event)
+    hue_canvas.bind("<B1-Motion>", _coalesce(_on_hue_event))
     alpha_canvas.bind("<Button-1>", _on_alpha_event)
-    alpha_canvas.bind("<B1-Motion>", _on_alpha_event)
+    alpha_canvas.bind("<B1-Motion>", _coalesce(_on_alpha_event))
 
     hex_entry.bind("<Return>", _commit_hex)
     hex_entry.bind("<FocusOut>", _commit_hex)
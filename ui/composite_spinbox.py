@@ -4,7 +4,8 @@ import tkinter as tk
 from collections.abc import Callable
 from enum import StrEnum
 from tkinter import ttk
-from typing import Any
+from typing import Any, ClassVar
+from weakref import WeakSet
 
 
 class Justify(StrEnum):
@@ -16,6 +17,9 @@ class Justify(StrEnum):
 
 
 class Composite_Spinbox(ttk.Frame):
+    # ttk styles live in the Tk interpreter, so configure the button style once per root rather than per widget
+    _styled_roots: ClassVar[WeakSet[tk.Misc]] = WeakSet()
+
     def __init__(
         self,
         master: tk.Misc,
@@ -26,6 +30,7 @@ class Composite_Spinbox(ttk.Frame):
         textvariable: tk.Variable | None = None,
         width: int = 6,
         command: Callable[[], None] | None = None,
+        commit_command: Callable[[], None] | None = None,
         wrap: bool = False,
         state: str = "normal",
         justify: Justify = Justify.right,
@@ -41,6 +46,7 @@ class Composite_Spinbox(ttk.Frame):
             textvariable: Optional Tk variable for the entry.
             width: Entry width in characters.
             command: Optional callback for value changes.
+            commit_command: Optional callback for explicit commits (Return/FocusOut); defaults to command.
             wrap: Whether to wrap around at bounds.
             state: Initial widget state.
             justify: Entry text justification.
@@ -52,6 +58,10 @@ class Composite_Spinbox(ttk.Frame):
         self._inc = increment
         self._wrap = wrap
         self._command = command
+        self._commit_command = commit_command
+        self._int_mode = True
+        self._span: int | float = 0
+        self._refresh_mode()
 
         self.var = textvariable or tk.StringVar(value=str(self._min))
 
@@ -61,8 +71,10 @@ class Composite_Spinbox(ttk.Frame):
         btncol.grid(row=0, column=1, sticky="", padx=0, pady=4)
         self.columnconfigure(0, weight=1)
 
-        style = ttk.Style()
-        style.configure("SpinButton.TButton", padding=1, font=("TkDefaultFont", 6))
+        root = self._root()
+        if root not in Composite_Spinbox._styled_roots:
+            ttk.Style(root).configure("SpinButton.TButton", padding=1, font=("TkDefaultFont", 6))
+            Composite_Spinbox._styled_roots.add(root)
         self.btn_up = ttk.Button(
             btncol, text="▲", width=1, style="SpinButton.TButton", command=self._bump_up, takefocus=0
         )
@@ -101,9 +113,20 @@ class Composite_Spinbox(ttk.Frame):
         Args;
             value: The new value.
         """
-        self.var.set(str(value))
+        self._store(str(value))
         self._validate_and_clamp(call_command=False)
 
+    def set_silent(self, value: int | float) -> None:
+        """Set an already in-range value without re-parsing or clamping it.
+
+        Meant for callers mirroring their own validated state back into the widget;
+        the command is never run.
+
+        Args;
+            value: The new value.
+        """
+        self._store(self._format(value))
+
     def set_justify(self, justify: Justify) -> None:
         """Set the entry text justification.
 
@@ -145,6 +168,9 @@ class Composite_Spinbox(ttk.Frame):
             self._wrap = kw.pop("wrap")
         if "command" in kw:
             self._command = kw.pop("command")
+        if "commit_command" in kw:
+            self._commit_command = kw.pop("commit_command")
+        self._refresh_mode()
         if "state" in kw:
             self.state(kw.pop("state"))
 
@@ -168,29 +194,45 @@ class Composite_Spinbox(ttk.Frame):
             self._bump_down()
         return "break"
 
+    def _refresh_mode(self) -> None:
+        # derived from the range/step so _parse/_format/_bump don't re-derive them on every key repeat
+        inc = self._inc
+        self._int_mode = isinstance(inc, int) or (isinstance(inc, float) and inc.is_integer())
+        self._span = self._max - self._min
+
     def _parse(self) -> int | float:
         s = str(self.var.get()).strip()
         try:
-            v = int(s)
+            return int(s)
+        except ValueError:
+            pass
+        # typed decimals still round-trip in integer mode; _format rounds them
+        try:
+            return float(s)
         except ValueError:
-            try:
-                v = float(s)
-            except ValueError:
-                v = self._min
-        return v
+            return self._min
 
     def _format(self, v: int | float) -> str:
-        if isinstance(self._inc, int) or (isinstance(self._inc, float) and self._inc.is_integer()):
-            return str(round(v))
+        if self._int_mode:
+            return str(v) if type(v) is int else str(round(v))
         return f"{v:.6g}"
 
+    def _store(self, text: str) -> bool:
+        # compare against the entry text so no-op writes don't fire the variable's traces (and IntVars can't raise)
+        if self.entry.get() == text:
+            return False
+        self.var.set(text)
+        return True
+
     def _validate_and_clamp(self, call_command: bool = True) -> None:
         v = self._parse()
         if not self._wrap:
             v = min(max(v, self._min), self._max)
-        self.var.set(self._format(v))
-        if call_command and self._command:
-            self._command()
+        self._store(self._format(v))
+        if call_command:
+            command = self._commit_command or self._command
+            if command:
+                command()
 
     def _validate_event(self, _e: tk.Event | None = None) -> None:
         self._validate_and_clamp(call_command=True)
@@ -200,15 +242,15 @@ class Composite_Spinbox(ttk.Frame):
         step = self._inc * direction
         v_next = v + step
         if self._wrap:
-            span = self._max - self._min
+            span = self._span
             if span > 0:
                 v_next = self._min + ((v_next - self._min) % span)
             else:
                 v_next = self._min
         else:
             v_next = min(max(v_next, self._min), self._max)
-        self.var.set(self._format(v_next))
-        if self._command:
+        # pinned against a bound: nothing changed, so don't re-run the command either
+        if self._store(self._format(v_next)) and self._command:
             self._command()
 
     def _bump_up(self) -> None:
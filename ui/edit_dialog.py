@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import tkinter as tk
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, StrEnum
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from PIL import Image, ImageTk
 
 from disk.export import _emit_pil_plan
-from models.assets import SVG_SUPPORTED, Icon_Name, _builtin_icon_plan, _open_rgba
+from models.assets import SVG_SUPPORTED, Icon_Name, _builtin_icon_plan
 from models.geo import Icon_Source, Icon_Type, Point
 from models.styling import Colours
 from ui.bars import Colour_Palette
@@ -22,11 +26,31 @@ if TYPE_CHECKING:
     from controllers.app import App
 
 ICON_PICKER_COLUMNS = 6
+PICTURE_CHUNK = 16
+# picture decodes release the GIL, so a few workers keep large libraries from blocking the Tk thread;
+# results are pasted back by Icon_Gallery._poll_thumbs because Tk must only be touched from its own thread
+_THUMB_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 2), thread_name_prefix="lw-thumbs")
+# (decode, target image, picture still owed its final thumbnail after this preview) for work on the pool
+_ThumbJob = tuple[Future[Image.Image | None], ImageTk.PhotoImage, Path | None]
+
+
+@lru_cache(maxsize=256)
+def _builtin_thumb(name: Icon_Name, size: int) -> Image.Image:
+    # rasterised once per process; each gallery only wraps these in PhotoImages for its own window
+    plan = _builtin_icon_plan(name, size - 8, Colours.white.hexh)
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    _emit_pil_plan(img, plan, size // 2, size // 2, 0)
+    return img
 
 
 class Icon_Gallery(tk.Toplevel):
     """Popup gallery for selecting icons."""
 
+    _blank_ph: ClassVar[tk.PhotoImage | None] = None
+    # builtin thumbnails as Tk images, shared by every gallery opened from the same interpreter
+    _builtin_phs: ClassVar[dict[tuple[Icon_Name, int], ImageTk.PhotoImage]] = {}
+    _builtin_phs_tk: ClassVar[Any] = None
+
     def __init__(
         self,
         master: tk.Misc,
@@ -58,6 +82,11 @@ class Icon_Gallery(tk.Toplevel):
         self.resizable(False, False)
         self.result: Icon_Source | None = None
         self._thumb_cache: dict[tuple, ImageTk.PhotoImage] = {}
+        self._thumb_jobs: list[_ThumbJob] = []
+        self._thumb_poll: str | None = None
+        self._pending_pics: Iterator[Path] = iter(())
+        self._pics_after: str | None = None
+        self._blank = self._shared_blank(self._thumb_size)
 
         self._grids: list[_ScrollGrid] = []
         self._cols: int | None = ICON_PICKER_COLUMNS
@@ -105,6 +134,7 @@ class Icon_Gallery(tk.Toplevel):
         btns.pack(fill="x", padx=8, pady=(0, 8))
 
         self.bind("<Escape>", lambda e: self._cancel())
+        self.bind("<Destroy>", self._on_destroy, add="+")
         self.update_idletasks()
         if at:
             self.geometry(f"+{at.x}+{at.y}")
@@ -114,6 +144,14 @@ class Icon_Gallery(tk.Toplevel):
         self.deiconify()
         self.grab_set()
 
+    def _shared_blank(self, size: int) -> tk.PhotoImage:
+        # one placeholder for every gallery button until its thumbnail is revealed; Tk images belong to
+        # the interpreter, so it is only rebuilt for a different root or size
+        blank = Icon_Gallery._blank_ph
+        if blank is None or blank.tk is not self.tk or blank.width() != size:
+            blank = Icon_Gallery._blank_ph = tk.PhotoImage(master=self._root(), width=size, height=size)
+        return blank
+
     def _resize_to_req(self) -> None:
         self.update_idletasks()
         w, h = self.winfo_reqwidth(), self.winfo_reqheight()
@@ -134,33 +172,38 @@ class Icon_Gallery(tk.Toplevel):
     # ---------- built-ins ----------
     def _build_builtins(self, parent: tk.Widget) -> None:
         frame = _ScrollGrid(parent, columns=self._cols)
+        body, blank, add = frame.body, self._blank, frame.add
         for name in Icon_Name:
-            thumb = self._thumb_for_builtin(name)
             b = ttk.Button(
-                frame.body,
-                image=thumb,
+                body,
+                image=blank,
                 text=name.value.replace("_", " ").title(),
                 compound="top",
                 command=lambda n=name: self._choose(Icon_Source.builtin(n)),
             )
-            frame.add(b)
+            add(b, thumb=lambda n=name: self._thumb_for_builtin(n))
         frame.pack(fill="both", expand=True)
         frame.force_layout()
         self._grids.append(frame)
 
-    def _thumb_for_builtin(self, name: Icon_Name) -> ImageTk.PhotoImage:
-        key = (Icon_Type.builtin, name.name)
-        if key in self._thumb_cache:
-            return self._thumb_cache[key]
-
-        plan = _builtin_icon_plan(name, self._thumb_size - 8, Colours.white.hexh)
-
-        img = Image.new("RGBA", (self._thumb_size, self._thumb_size), (0, 0, 0, 0))
-
-        _emit_pil_plan(img, plan, self._thumb_size // 2, self._thumb_size // 2, 0)
+    @staticmethod
+    def _drop_builtin_phs(e: tk.Event) -> None:
+        # the root's <Destroy> also fires for each child; only the root itself takes the images with it
+        if isinstance(e.widget, tk.Tk):
+            Icon_Gallery._builtin_phs.clear()
+            Icon_Gallery._builtin_phs_tk = None
 
-        ph = ImageTk.PhotoImage(img)
-        self._thumb_cache[key] = ph
+    def _thumb_for_builtin(self, name: Icon_Name) -> ImageTk.PhotoImage:
+        # re-opening the gallery reuses these rather than converting every builtin into a fresh Tk image
+        phs = Icon_Gallery._builtin_phs
+        if Icon_Gallery._builtin_phs_tk is not self.tk:
+            phs.clear()
+            Icon_Gallery._builtin_phs_tk = self.tk
+            self._root().bind("<Destroy>", Icon_Gallery._drop_builtin_phs, add="+")
+        key = (name, self._thumb_size)
+        ph = phs.get(key)
+        if ph is None:
+            ph = phs[key] = ImageTk.PhotoImage(_builtin_thumb(name, self._thumb_size), master=self._root())
         return ph
 
     # ---------- pictures ----------
@@ -172,29 +215,90 @@ class Icon_Gallery(tk.Toplevel):
         self._grids.append(self._pics_frame)
 
     def _refresh_pictures(self) -> None:
+        if self._pics_after is not None:
+            self.after_cancel(self._pics_after)
+            self._pics_after = None
         self._pics_frame.clear()
-        for p in self.app.asset_lib.list_pictures():
-            thumb = self._thumb_for_picture(p)
+        self._pending_pics = iter(self.app.asset_lib.list_pictures())
+        # the first chunk is built now so the opening rows paint straight away; the rest trickle in
+        self._drain_pictures()
+
+    def _drain_pictures(self) -> None:
+        self._pics_after = None
+        if not self.winfo_exists():
+            return
+        chunk = list(islice(self._pending_pics, PICTURE_CHUNK))
+        body, blank, add = self._pics_frame.body, self._blank, self._pics_frame.add
+        for p in chunk:
             btn = ttk.Button(
-                self._pics_frame.body,
-                image=thumb,
+                body,
+                image=blank,
                 text=p.name,
                 compound="top",
                 command=lambda path=p: self._choose(Icon_Source.picture(path)),
             )
-            # btn.image = thumb
-            self._pics_frame.add(btn)
-        self._pics_frame.body.update_idletasks()
+            add(btn, thumb=lambda path=p: self._thumb_for_picture(path))
+        if len(chunk) == PICTURE_CHUNK:
+            # a timer rather than after_idle: __init__'s update_idletasks would otherwise drain everything up front
+            self._pics_after = self.after(1, self._drain_pictures)
 
     def _thumb_for_picture(self, path: Path) -> ImageTk.PhotoImage:
         key = ("pic", str(path))
         if key in self._thumb_cache:
             return self._thumb_cache[key]
-        im = _open_rgba(path, self._thumb_size, self._thumb_size)
-        ph = ImageTk.PhotoImage(im)
+        lib = self.app.asset_lib
+        # pictures already decoded by an earlier gallery are shown straight away, without a pool round trip
+        im = lib.cached_thumbnail(path, self._thumb_size)
+        if im is not None:
+            ph = self._thumb_cache[key] = ImageTk.PhotoImage(im, master=self)
+            return ph
+        # decoding happens on the pool; the button shows this empty image until _poll_thumbs pastes into it
+        ph = ImageTk.PhotoImage("RGBA", (self._thumb_size, self._thumb_size), master=self)
         self._thumb_cache[key] = ph
+        # a cheap NEAREST preview goes first; _poll_thumbs queues the LANCZOS thumbnail once it has landed
+        self._thumb_jobs.append((_THUMB_POOL.submit(lib.preview_thumbnail, path, self._thumb_size), ph, path))
+        if self._thumb_poll is None:
+            self._thumb_poll = self.after(15, self._poll_thumbs)
         return ph
 
+    def _poll_thumbs(self) -> None:
+        # Tk isn't thread-safe, so finished decodes are collected and pasted from the Tk thread
+        self._thumb_poll = None
+        if not self.winfo_exists():
+            return
+        waiting: list[_ThumbJob] = []
+        lib = self.app.asset_lib
+        for fut, ph, owed in self._thumb_jobs:
+            if not fut.done():
+                waiting.append((fut, ph, owed))
+                continue
+            try:
+                im = fut.result()
+                if im is not None:
+                    ph.paste(im)
+            except Exception:
+                pass
+            if owed is not None:
+                # queued behind every outstanding preview, so the whole page gets a first paint before any
+                # slow resample runs
+                waiting.append((_THUMB_POOL.submit(lib.thumbnail, owed, self._thumb_size), ph, None))
+        self._thumb_jobs = waiting
+        if waiting:
+            self._thumb_poll = self.after(15, self._poll_thumbs)
+
+    def _on_destroy(self, e: tk.Event) -> None:
+        # the pool is shared, so decodes queued for a closed gallery are cancelled rather than left to run
+        if e.widget is not self:
+            return
+        for fut, _ph, _owed in self._thumb_jobs:
+            fut.cancel()
+        self._thumb_jobs = []
+        self._pending_pics = iter(())
+        for job in (self._thumb_poll, self._pics_after):
+            if job is not None:
+                self.after_cancel(job)
+        self._thumb_poll = self._pics_after = None
+
     # ---------- recent ----------
     def _build_recent(self, parent: tk.Widget, recent: list[Icon_Source]) -> None:
         allowed = set()
@@ -208,15 +312,17 @@ class Icon_Gallery(tk.Toplevel):
             if src.kind not in allowed:
                 continue
             if src.kind == Icon_Type.builtin and src.name:
-                thumb = self._thumb_for_builtin(src.name)
+                thumb = partial(self._thumb_for_builtin, src.name)
                 txt = src.name.name
             elif src.kind == Icon_Type.picture and src.src:
-                thumb = self._thumb_for_picture(src.src)
+                thumb = partial(self._thumb_for_picture, src.src)
                 txt = src.src.name
             else:
                 continue
-            b = ttk.Button(frame.body, image=thumb, text=txt, compound="top", command=lambda s=src: self._choose(s))
-            frame.add(b)
+            b = ttk.Button(
+                frame.body, image=self._blank, text=txt, compound="top", command=lambda s=src: self._choose(s)
+            )
+            frame.add(b, thumb=thumb)
         frame.pack(fill="both", expand=True)
         frame.force_layout()
         self._grids.append(frame)
@@ -276,6 +382,10 @@ class _ScrollGrid(ttk.Frame):
         self._cell_h = 0
         self._vs = vs
         self._layout_pending = False
+        # widgets still showing a placeholder, with the factory for their real thumbnail
+        self._lazy: dict[tk.Widget, Callable[[], ImageTk.PhotoImage]] = {}
+        self._placed: dict[tk.Widget, tuple[int, int]] = {}
+        self._reveal_pending = False
 
         def _on_wheel(ev: tk.Event) -> str | None:
             try:
@@ -295,7 +405,21 @@ class _ScrollGrid(ttk.Frame):
             w.bind("<Button-4>", _on_wheel)  # X11
             w.bind("<Button-5>", _on_wheel)  # X11
 
-        canvas.configure(yscrollcommand=vs.set)
+        def _forward_wheel(ev: tk.Event, c=canvas) -> str:
+            if hasattr(ev, "delta") and ev.delta:
+                c.event_generate("<MouseWheel>", delta=ev.delta)
+            else:
+                num = getattr(ev, "num", 0)
+                if num in (4, 5):
+                    c.event_generate(f"<Button-{num}>")
+            return "break"
+
+        self._wheel_tag = f"LW.GridWheel{self}"
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._wheel_tag, seq, _forward_wheel)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+        canvas.configure(yscrollcommand=self._on_yscroll)
         canvas.grid(row=0, column=0, sticky="nsew")
         vs.grid(row=0, column=1, sticky="ns")
         self.columnconfigure(0, weight=1)
@@ -330,9 +454,14 @@ class _ScrollGrid(ttk.Frame):
         for r in range(rows):
             self.body.grid_rowconfigure(r, minsize=self._cell_h, uniform="tiles")
 
+        # only (re)grid cells whose position changed; new widgets are first gridded here
+        placed = self._placed
+        pad = self.pad
         for i, w in enumerate(self.widgets):
-            r, c = divmod(i, cols)
-            w.grid_configure(row=r, column=c, padx=self.pad, pady=self.pad, sticky="")
+            cell = divmod(i, cols)
+            if placed.get(w) != cell:
+                w.grid(row=cell[0], column=cell[1], padx=pad, pady=pad, sticky="")
+                placed[w] = cell
 
         if self.columns and self.columns > 0 and self._cell_w > 0:
             sbw = self._vs.winfo_reqwidth() or 12
@@ -341,6 +470,40 @@ class _ScrollGrid(ttk.Frame):
 
         self.body.update_idletasks()
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._schedule_reveal()
+
+    def _on_destroy(self, e: tk.Event) -> None:
+        # class bindings outlive the widget, so drop this grid's tag with it
+        if e.widget is self:
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.unbind_class(self._wheel_tag, seq)
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self._vs.set(first, last)
+        self._schedule_reveal()
+
+    def _schedule_reveal(self) -> None:
+        if self._lazy and not self._reveal_pending:
+            self._reveal_pending = True
+            self.after_idle(self._reveal_visible)
+
+    def _reveal_visible(self) -> None:
+        # swap placeholders for real thumbnails on cells that intersect the viewport
+        self._reveal_pending = False
+        if not self._lazy or not self.winfo_exists():
+            return
+        # rows are uniform _cell_h bands, so the visible range comes from arithmetic instead of two
+        # winfo round trips per pending widget
+        cell_h = max(1, self._cell_h)
+        top = self.canvas.canvasy(0)
+        first = int(top) // cell_h
+        last = int(top + self.canvas.winfo_height()) // cell_h
+        placed = self._placed
+        for w, make in list(self._lazy.items()):
+            cell = placed.get(w)
+            if cell is not None and first <= cell[0] <= last:
+                del self._lazy[w]
+                w.configure(image=make())
 
     def _on_canvas_resize(self, e: tk.Event) -> None:
         self.canvas.itemconfigure(self._win, width=e.width)
@@ -349,21 +512,12 @@ class _ScrollGrid(ttk.Frame):
             self.after_idle(self._relayout)
 
     # ---- public API ----
-    def add(self, widget: tk.Widget) -> None:
-        widget.grid(row=0, column=0)
-
-        def _forward_wheel(ev: tk.Event, c=self.canvas) -> str:
-            if hasattr(ev, "delta") and ev.delta:
-                c.event_generate("<MouseWheel>", delta=ev.delta)
-            else:
-                num = getattr(ev, "num", 0)
-                if num in (4, 5):
-                    c.event_generate(f"<Button-{num}>")
-            return "break"
-
-        widget.bind("<MouseWheel>", _forward_wheel)
-        widget.bind("<Button-4>", _forward_wheel)  # X11
-        widget.bind("<Button-5>", _forward_wheel)  # X11
+    def add(self, widget: tk.Widget, thumb: Callable[[], ImageTk.PhotoImage] | None = None) -> None:
+        # gridding is left to the next _relayout so a batch of adds costs one layout pass
+        if thumb is not None:
+            self._lazy[widget] = thumb
+        # wheel forwarding is bound once on a grid-wide tag instead of three new Tcl commands per cell
+        widget.bindtags((self._wheel_tag, *widget.bindtags()))
         self.widgets.append(widget)
         if not self._layout_pending:
             self._layout_pending = True
@@ -373,6 +527,8 @@ class _ScrollGrid(ttk.Frame):
         for c in list(self.body.children.values()):
             c.destroy()
         self.widgets.clear()
+        self._lazy.clear()
+        self._placed.clear()
         if not self._layout_pending:
             self._layout_pending = True
             self.after_idle(self._relayout)
@@ -413,6 +569,30 @@ class _FieldSpec:
     choices_dict: Mapping[str, Any] | Callable[[], Mapping[str, Any]] | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _CompiledField:
+    """A schema entry with its reader and numeric bounds resolved once per dialog."""
+
+    name: str
+    spec: dict[str, Any]
+    read: Callable[[str, dict], Any]
+    check: Callable[[Any], None] | None
+
+
+def _bounds_check(label: str, lo: int | float | None, hi: int | float | None) -> Callable[[Any], None] | None:
+    """Build a min/max validator for a numeric field, or None when it is unbounded."""
+    if lo is None and hi is None:
+        return None
+
+    def _check(v: Any) -> None:
+        if lo is not None and v < lo:
+            raise ValueError(f"{label} must be ≥ {lo}")
+        if hi is not None and v > hi:
+            raise ValueError(f"{label} must be ≤ {hi}")
+
+    return _check
+
+
 def _coerce_schema_item(item: Any) -> dict[str, Any]:
     """
     Normalizes either a legacy dict schema entry or a typed _FieldSpec
@@ -489,6 +669,30 @@ class GenericEditDialog(simpledialog.Dialog):
         self.values: dict[str, Any] = dict(values or {})
         self.widgets: dict[str, tk.Widget] = {}
         self._meta: dict[str, dict[str, Any]] = {}
+        self._builders: dict[str, Callable[[tk.Widget, dict, Any], tk.Widget]] = {
+            "bool": self._build_bool,
+            "int": self._build_entry,
+            "float": self._build_entry,
+            "str": self._build_entry,
+            "text": self._build_text,
+            "choice": self._build_choice,
+            "choice_dict": self._build_choice_dict,
+            "colour": self._build_colour,
+            "icon_builtin": self._build_icon_builtin,
+            "icon_picture": self._build_icon_picture,
+        }
+        self._readers: dict[str, Callable[[str, dict], Any]] = {
+            "bool": self._read_bool,
+            "text": self._read_text,
+            "choice": self._read_choice,
+            "choice_dict": self._read_choice_dict,
+            "int": self._read_int,
+            "float": self._read_float,
+            "str": self._read_str,
+            "colour": self._read_str,
+        }
+        # validate() walks this instead of re-deriving kind/reader/bounds from the dicts on every submit
+        self._fields: list[_CompiledField] = [self._compile_field(fld) for fld in self.schema]
         super().__init__(app.root, title)
 
     # ---- Dialog hooks ----
@@ -529,17 +733,12 @@ class GenericEditDialog(simpledialog.Dialog):
         """
         out: dict[str, Any] = {}
         try:
-            for fld in self.schema:
-                name = fld["name"]
-                kind = str(fld.get("kind", "str")).lower()
-                raw = self._read_value(name, kind, fld)
+            for f in self._fields:
+                raw = f.read(f.name, f.spec)
                 # central numeric validation
-                if kind in ("int", "float"):
-                    if "min" in fld and raw < fld["min"]:
-                        raise ValueError(f"{fld.get('label', name)} must be ≥ {fld['min']}")
-                    if "max" in fld and raw > fld["max"]:
-                        raise ValueError(f"{fld.get('label', name)} must be ≤ {fld['max']}")
-                out[name] = raw
+                if f.check is not None:
+                    f.check(raw)
+                out[f.name] = raw
         except Exception as e:
             try:
                 messagebox.showerror("Invalid input", str(e), parent=self)
@@ -560,19 +759,7 @@ class GenericEditDialog(simpledialog.Dialog):
         name = fld["name"]
         self._meta[name] = {}
 
-        BUILDERS: dict[str, Callable[[tk.Widget, dict, Any], tk.Widget]] = {
-            "bool": self._build_bool,
-            "int": self._build_entry,
-            "float": self._build_entry,
-            "str": self._build_entry,
-            "text": self._build_text,
-            "choice": self._build_choice,
-            "choice_dict": self._build_choice_dict,
-            "colour": self._build_colour,
-            "icon_builtin": self._build_icon_builtin,
-            "icon_picture": self._build_icon_picture,
-        }
-        builder = BUILDERS.get(kind, self._build_entry)
+        builder = self._builders.get(kind, self._build_entry)
         w = builder(parent, fld, init_val)
         self.widgets[name] = w
         return w
@@ -584,8 +771,12 @@ class GenericEditDialog(simpledialog.Dialog):
 
     def _build_entry(self, parent: tk.Widget, fld: dict, init_val: Any) -> tk.Widget:
         var = tk.StringVar(value=self._stringify_init(init_val))
-        self._meta[fld["name"]]["var"] = var
-        return ttk.Entry(parent, textvariable=var)
+        meta = self._meta[fld["name"]]
+        meta["var"] = var
+        ent = ttk.Entry(parent, textvariable=var)
+        # readers go straight to the widget instead of through the variable
+        meta["get"] = ent.get
+        return ent
 
     def _build_text(self, parent: tk.Widget, fld: dict, init_val: Any) -> tk.Widget:
         txt = tk.Text(parent, height=4, width=40)
@@ -599,14 +790,15 @@ class GenericEditDialog(simpledialog.Dialog):
             keys = sorted(keys, key=str.casefold)
         init_key = str(init_val) if init_val is not None else (keys[0] if keys else "")
         var = tk.StringVar(value=init_key)
-        self._meta[fld["name"]]["var"] = var
-        return ttk.Combobox(parent, values=keys, textvariable=var, state="readonly")
+        meta = self._meta[fld["name"]]
+        meta["var"] = var
+        box = ttk.Combobox(parent, values=keys, textvariable=var, state="readonly")
+        meta["get"] = box.get
+        return box
 
     def _build_choice_dict(self, parent: tk.Widget, fld: dict, init_val: Any) -> tk.Widget:
         mapping = _resolve_choices_map(fld.get("choices"))
-        keys = list(mapping.keys())
-        if fld.get("sort", True):
-            keys = sorted(keys, key=str.casefold)
+        keys: Sequence[str] = sorted(mapping, key=str.casefold) if fld.get("sort", True) else tuple(mapping)
         init_key = keys[0] if keys else ""
         for k, v in mapping.items():
             if v == init_val or (isinstance(v, Path) and str(v) == str(init_val)):
@@ -615,8 +807,11 @@ class GenericEditDialog(simpledialog.Dialog):
         var = tk.StringVar(value=init_key)
         meta = self._meta[fld["name"]]
         meta["var"] = var
-        meta["map"] = mapping
-        return ttk.Combobox(parent, values=keys, textvariable=var, state="readonly")
+        # bound once so validate() does a single call per read
+        meta["lookup"] = mapping.__getitem__
+        box = ttk.Combobox(parent, values=keys, textvariable=var, state="readonly")
+        meta["get"] = box.get
+        return box
 
     def _build_colour(self, parent: tk.Widget, fld: dict, init_val: Any) -> tk.Widget:
         init = str(init_val) if init_val is not None else ""
@@ -692,19 +887,12 @@ class GenericEditDialog(simpledialog.Dialog):
         return frm
 
     # ---- readers (per kind) ----
-    def _read_value(self, name: str, kind: str, fld: dict) -> Any:
-        READERS: dict[str, Callable[[str, dict], Any]] = {
-            "bool": self._read_bool,
-            "text": self._read_text,
-            "choice": self._read_choice,
-            "choice_dict": self._read_choice_dict,
-            "int": self._read_int,
-            "float": self._read_float,
-            "str": self._read_str,
-            "colour": self._read_str,
-        }
-        reader = READERS.get(kind, self._read_str)
-        return reader(name, fld)
+    def _compile_field(self, fld: dict[str, Any]) -> _CompiledField:
+        name = fld["name"]
+        kind = str(fld.get("kind", "str")).lower()
+        label = fld.get("label", name)
+        check = _bounds_check(label, fld.get("min"), fld.get("max")) if kind in ("int", "float") else None
+        return _CompiledField(name=name, spec=fld, read=self._readers.get(kind, self._read_str), check=check)
 
     def _read_bool(self, name: str, fld: dict) -> bool:
         return bool(self._meta[name]["var"].get())
@@ -713,18 +901,23 @@ class GenericEditDialog(simpledialog.Dialog):
         w = self.widgets[name]
         return w.get("1.0", "end-1c")  # pyright: ignore
 
+    def _read_raw(self, name: str) -> Any:
+        meta = self._meta[name]
+        get = meta.get("get")
+        return get() if get is not None else meta["var"].get()
+
     def _read_choice(self, name: str, fld: dict) -> str:
-        return str(self._meta[name]["var"].get()).strip()
+        return str(self._read_raw(name)).strip()
 
     def _read_choice_dict(self, name: str, fld: dict) -> Any:
-        key = str(self._meta[name]["var"].get())
-        mapping: dict[str, Any] = self._meta[name].get("map", {})
-        if key not in mapping:
-            raise ValueError(f"{fld.get('label', name)}: unknown option '{key}'")
-        return mapping[key]
+        key = str(self._read_raw(name))
+        try:
+            return self._meta[name]["lookup"](key)
+        except KeyError:
+            raise ValueError(f"{fld.get('label', name)}: unknown option '{key}'") from None
 
     def _read_str(self, name: str, fld: dict) -> str:
-        return str(self._meta[name]["var"].get()).strip()
+        return str(self._read_raw(name)).strip()
 
     def _read_int(self, name: str, fld: dict) -> int:
         s = self._read_str(name, fld)